@@ -0,0 +1,121 @@
+"""
+Shared pytest fixtures for the GitHub PR analyzer test suite.
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from github_client import GitHubClient
+
+
+# Reviewer workload summary in the shape ReviewerWorkloadAnalyzer produces
+_REVIEWER_SUMMARY = {
+    'metadata': {
+        'analysis_date': '2024-12-15T12:00:00',
+        'total_prs_analyzed': 25,
+        'include_teams': True,
+        'overload_threshold': 15,
+        'org_name': 'testorg'
+    },
+    'reviewer_data': {
+        'alice': {
+            'login': 'alice',
+            'name': 'Alice Johnson',
+            'total_requests': 20,
+            'pr_numbers': [100, 101, 102, 103, 104],
+            'request_sources': {'individual': 3, 'team:core': 1, 'team:backend': 1},
+            'first_request_date': '2024-11-01T10:00:00Z',
+            'last_request_date': '2024-12-10T15:30:00Z'
+        },
+        'bob': {
+            'login': 'bob',
+            'name': 'Bob Smith',
+            'total_requests': 8,
+            'pr_numbers': [105, 106, 107],
+            'request_sources': {'individual': 3},
+            'first_request_date': '2024-11-15T09:00:00Z',
+            'last_request_date': '2024-12-05T14:00:00Z'
+        },
+        'team:frontend': {
+            'login': 'team:frontend',
+            'name': 'Team: Frontend',
+            'total_requests': 12,
+            'pr_numbers': [108, 109, 110, 111],
+            'request_sources': {'team:frontend': 4},
+            'first_request_date': '2024-11-20T11:00:00Z',
+            'last_request_date': '2024-12-08T16:00:00Z'
+        }
+    },
+    'statistics': {
+        'total_reviewers': 3,
+        'total_requests': 40,
+        'mean_requests': 13.33,
+        'median_requests': 12,
+        'std_dev_requests': 6.02,
+        'min_requests': 8,
+        'max_requests': 20
+    },
+    'overload_analysis': {
+        'OVERLOADED': ['alice'],
+        'HIGH': ['team:frontend'],
+        'NORMAL': ['bob']
+    },
+    'distribution_analysis': {
+        'concentration_ratio': 0.5,
+        'gini_coefficient': 0.35,
+        'reviewer_diversity_score': 0.65,
+        'top_reviewers': [
+            {'login': 'alice', 'name': 'Alice Johnson', 'total_requests': 20, 'percentage_of_total': 50.0}
+        ],
+        'underutilized_reviewers': []
+    }
+}
+
+
+@pytest.fixture
+def reviewer_summary():
+    """Per-test deep copy of the reviewer workload summary, safe to modify."""
+    return copy.deepcopy(_REVIEWER_SUMMARY)
+
+
+@pytest.fixture(scope="session")
+def _shared_client():
+    """Single GitHubClient shared by tests that only mock out its calls."""
+    client = GitHubClient("test_token")
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def github_client(_shared_client):
+    """
+    Fixture providing a GitHubClient instance for testing.
+    
+    A shallow copy shares the session-scoped client's Session, but attributes
+    a test stubs out on it (e.g. _make_api_request) stay local to that test.
+    The ETag cache and fan-out worker pool are replaced so no cached response
+    or worker Session carries over between tests.
+    """
+    client = copy.copy(_shared_client)
+    client._etag_cache = OrderedDict()
+    client._etag_cache_bytes = 0
+    client._etag_lock = threading.Lock()
+    client._thread_local = threading.local()
+    client._executor = None
+    client._worker_sessions = []
+    client._executor_lock = threading.Lock()
+    yield client
+    client._shutdown_workers()
+
+
+@pytest.fixture
+def mock_get(monkeypatch):
+    """Fixture replacing requests.Session.get with a Mock for the test."""
+    mock = Mock()
+    monkeypatch.setattr(requests.Session, 'get', mock)
+    return mock
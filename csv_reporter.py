@@ -6,17 +6,146 @@ to CSV format with all three timing metrics and detailed PR information.
 """
 
 import csv
+import io
 import logging
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, TextIO, Union
 from pathlib import Path
 
 
+class _ReportDialect(csv.Dialect):
+    """
+    Explicit CSV dialect for every file this module writes: minimal quoting, CRLF line endings.
+    
+    Reports and tracking files share it so the tool never mixes line endings,
+    and CRLF matches tracking CSVs written before the dialect existed.
+    """
+    delimiter = ','
+    quotechar = '"'
+    escapechar = None
+    doublequote = True
+    skipinitialspace = False
+    lineterminator = '\r\n'
+    quoting = csv.QUOTE_MINIMAL
+
+
+csv.register_dialect('pr_analyzer', _ReportDialect)
+
+# Column order of the PR lifecycle CSV report
+CSV_HEADERS = (
+    'pr_number',
+    'title',
+    'state',
+    'created_at',
+    'merged_at',
+    'repository_name',
+    'pr_creator_github_id',
+    'pr_creator_username',
+    'time_to_first_review_hours',
+    'time_to_merge_hours',
+    'commit_lead_time_hours',
+    'has_reviews',
+    'review_count',
+    'comment_count',
+    'commit_count',
+    'is_merged'
+)
+
+# Column order of the reviewer workload CSV report
+REVIEWER_CSV_HEADERS = (
+    'reviewer_login',
+    'reviewer_name',
+    'reviewer_type',
+    'total_requests',
+    'pr_numbers',
+    'request_sources',
+    'first_request_date',
+    'last_request_date',
+    'avg_requests_per_month',
+    'percentage_of_total',
+    'workload_status',
+    'workload_category'
+)
+
+# PR detail keys feeding each CSV column, with the default used when a
+# record is missing that key
+_PR_DETAIL_FIELDS = (
+    ('pr_number', ''),
+    ('title', ''),
+    ('state', ''),
+    ('created_at', None),
+    ('merged_at', None),
+    ('repository_name', ''),
+    ('pr_creator_github_id', ''),
+    ('pr_creator_login', ''),
+    ('time_to_first_review_hours', None),
+    ('time_to_merge_hours', None),
+    ('commit_lead_time_hours', None),
+    ('has_reviews', False),
+    ('review_count', 0),
+    ('comment_count', 0),
+    ('commit_count', 0),
+    ('is_merged', False)
+)
+_get_pr_detail_fields = itemgetter(*(key for key, _ in _PR_DETAIL_FIELDS))
+
+# Human-readable workload category for each overload status; anything else
+# is reported as 'Normal Load'
+_WORKLOAD_CATEGORIES = {
+    'OVERLOADED': 'Overloaded',
+    'HIGH': 'High Load',
+    'NORMAL': 'Normal Load'
+}
+
+# Keys every PR detail must carry to be exported (in reporting order)
+_REQUIRED_PR_FIELDS = ('pr_number', 'repository_name', 'pr_creator_github_id', 'pr_creator_login')
+_REQUIRED_PR_FIELD_SET = frozenset(_REQUIRED_PR_FIELDS)
+
+# Top-level keys and per-reviewer fields a reviewer summary must carry
+_REQUIRED_SUMMARY_KEYS = ('reviewer_data', 'metadata', 'statistics', 'overload_analysis')
+_REQUIRED_SUMMARY_KEY_SET = frozenset(_REQUIRED_SUMMARY_KEYS)
+_REQUIRED_REVIEWER_FIELDS = ('login', 'total_requests', 'pr_numbers')
+_REQUIRED_REVIEWER_FIELD_SET = frozenset(_REQUIRED_REVIEWER_FIELDS)
+
+
 class CSVReportError(Exception):
     """Custom exception for CSV reporting related errors."""
     pass
 
 
+@lru_cache(maxsize=4096)
+def _format_datetime_cached(datetime_str: str) -> str:
+    """
+    Reformat an ISO 8601 timestamp as "YYYY-MM-DD HH:MM:SS UTC".
+    
+    Cached because PRs fetched in the same batch frequently share
+    created/merged timestamps.
+    
+    Args:
+        datetime_str: Non-empty ISO datetime string
+        
+    Returns:
+        Formatted datetime string, or the input unchanged if it cannot be parsed
+    """
+    try:
+        # Parse and reformat to ensure consistent format
+        if datetime_str.endswith('Z'):
+            datetime_str = datetime_str[:-1] + '+00:00'
+        
+        dt = datetime.fromisoformat(datetime_str)
+        # Format as YYYY-MM-DD HH:MM:SS UTC; isoformat() avoids strftime's
+        # format-string parsing, and the slice drops any UTC offset suffix
+        return dt.isoformat(' ', 'seconds')[:19] + ' UTC'
+        
+    except (ValueError, TypeError):
+        # Return original string if parsing fails
+        return str(datetime_str)
+
+
 class CSVReporter:
     """
     CSV reporter for GitHub PR lifecycle analysis results.
@@ -25,12 +154,13 @@ class CSVReporter:
     to CSV files with proper headers and data formatting.
     """
     
-    def __init__(self, output_path: str):
+    def __init__(self, output_path: Union[str, TextIO]):
         """
         Initialize CSV reporter with output file path.
         
         Args:
-            output_path: Path where the CSV file will be written
+            output_path: Path where the CSV file will be written, or a writable
+                         text stream (e.g. io.StringIO) to write the report into
             
         Raises:
             CSVReportError: If output path is invalid
@@ -38,12 +168,35 @@ class CSVReporter:
         if not output_path:
             raise CSVReportError("Output path is required")
         
-        self.output_path = Path(output_path)
         self.logger = logging.getLogger(__name__)
         
+        # Caller-owned stream: write into it directly without touching disk
+        if hasattr(output_path, 'write'):
+            self._stream = output_path
+            self.output_path = output_path
+            return
+        
+        self._stream = None
+        self.output_path = Path(output_path)
+        
         # Ensure output directory exists
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
     
+    @contextmanager
+    def _open_output(self) -> Iterator[TextIO]:
+        """
+        Yield a text handle to write the report into.
+        
+        A stream passed to the constructor is yielded as-is and left open for
+        the caller; otherwise the output file is opened (and closed) here.
+        """
+        if self._stream is not None:
+            yield self._stream
+            return
+        
+        with open(self.output_path, 'w', newline='', encoding='utf-8') as csvfile:
+            yield csvfile
+    
     def generate_report(self, analysis_results: Dict[str, Any]) -> str:
         """
         Generate CSV report from PR analysis results.
@@ -67,32 +220,58 @@ class CSVReporter:
         summary = analysis_results.get('summary', {})
         
         try:
-            # Generate CSV headers
-            headers = self._format_csv_headers()
-            
             # Format CSV rows
             rows = self._format_csv_rows(pr_details)
             
             # Write CSV file
-            with open(self.output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
+            with self._open_output() as csvfile:
+                writer = csv.writer(csvfile, dialect='pr_analyzer')
                 
                 # Write summary information as comments
                 self._write_summary_header(writer, summary)
                 
                 # Write headers
-                writer.writerow(headers)
+                writer.writerow(CSV_HEADERS)
                 
                 # Write data rows
-                writer.writerows(rows)
+                self._write_data_rows(csvfile, writer, rows)
             
-            self.logger.info(f"Generated CSV report with {len(pr_details)} PRs at {self.output_path}")
+            self.logger.info(f"Generated CSV report with {len(pr_details)} PRs at {self.get_output_path()}")
             
-            return str(self.output_path)
+            return self.get_output_path()
             
         except Exception as e:
             raise CSVReportError(f"Failed to generate CSV report: {e}")
     
+    def _write_data_rows(self, csvfile: TextIO, writer: Any, rows: List[List[str]]) -> None:
+        """
+        Write formatted data rows, bypassing the csv module when nothing needs quoting.
+        
+        Rows are joined with commas directly and emitted in a single write. If
+        any field contains a delimiter, quote or line break the rows are handed
+        to the csv writer instead, so the output is identical either way.
+        
+        Args:
+            csvfile: Open text handle the writer is bound to
+            writer: CSV writer instance
+            rows: Formatted rows of string fields
+        """
+        if not rows:
+            return
+        
+        lines = [','.join(row) for row in rows]
+        
+        # A row needs quoting iff a field holds a comma (more commas than
+        # separators), a quote character or a line break
+        for row, line in zip(rows, lines):
+            if (line.count(',') != len(row) - 1 or '"' in line
+                    or '\n' in line or '\r' in line):
+                writer.writerows(rows)
+                return
+        
+        terminator = writer.dialect.lineterminator
+        csvfile.write(terminator.join(lines) + terminator)
+    
     def _format_csv_headers(self) -> List[str]:
         """
         Define CSV column structure with all three timing metrics.
@@ -100,24 +279,7 @@ class CSVReporter:
         Returns:
             List of CSV column headers
         """
-        return [
-            'pr_number',
-            'title',
-            'state',
-            'created_at',
-            'merged_at',
-            'repository_name',
-            'pr_creator_github_id',
-            'pr_creator_username',
-            'time_to_first_review_hours',
-            'time_to_merge_hours',
-            'commit_lead_time_hours',
-            'has_reviews',
-            'review_count',
-            'comment_count',
-            'commit_count',
-            'is_merged'
-        ]
+        return list(CSV_HEADERS)
     
     def _format_csv_rows(self, pr_details: List[Dict[str, Any]]) -> List[List[str]]:
         """
@@ -134,28 +296,45 @@ class CSVReporter:
         
         rows = []
         
+        # Resolve formatters once rather than per cell
+        sanitize_text = self._sanitize_text
+        format_datetime = self._format_datetime
+        format_number = self._format_number
+        append_row = rows.append
+        
         for pr in pr_details:
             try:
-                row = [
-                    str(pr.get('pr_number', '')),
-                    self._sanitize_text(pr.get('title', '')),
-                    str(pr.get('state', '')),
-                    self._format_datetime(pr.get('created_at')),
-                    self._format_datetime(pr.get('merged_at')),
-                    str(pr.get('repository_name', '')),
-                    str(pr.get('pr_creator_github_id', '')),
-                    str(pr.get('pr_creator_login', '')),
-                    self._format_number(pr.get('time_to_first_review_hours')),
-                    self._format_number(pr.get('time_to_merge_hours')),
-                    self._format_number(pr.get('commit_lead_time_hours')),
-                    str(pr.get('has_reviews', False)),
-                    str(pr.get('review_count', 0)),
-                    str(pr.get('comment_count', 0)),
-                    str(pr.get('commit_count', 0)),
-                    str(pr.get('is_merged', False))
-                ]
+                # Records from PRLifecycleAnalyzer carry every key, so fetch them
+                # in one itemgetter call; partial records fall back to defaults
+                try:
+                    fields = _get_pr_detail_fields(pr)
+                except KeyError:
+                    fields = tuple(pr.get(key, default) for key, default in _PR_DETAIL_FIELDS)
                 
-                rows.append(row)
+                (pr_number, title, state, created_at, merged_at, repository_name,
+                 creator_id, creator_login, review_hours, merge_hours, lead_hours,
+                 has_reviews, review_count, comment_count, commit_count, is_merged) = fields
+                
+                # Timing metrics are floats (or None) straight from the analyzer,
+                # so format those inline and leave anything else to _format_number
+                append_row([
+                    str(pr_number),
+                    sanitize_text(title),
+                    str(state),
+                    format_datetime(created_at),
+                    format_datetime(merged_at),
+                    str(repository_name),
+                    str(creator_id),
+                    str(creator_login),
+                    f"{review_hours:.2f}" if type(review_hours) is float else format_number(review_hours),
+                    f"{merge_hours:.2f}" if type(merge_hours) is float else format_number(merge_hours),
+                    f"{lead_hours:.2f}" if type(lead_hours) is float else format_number(lead_hours),
+                    str(has_reviews),
+                    str(review_count),
+                    str(comment_count),
+                    str(commit_count),
+                    str(is_merged)
+                ])
                 
             except Exception as e:
                 self.logger.warning(f"Failed to format PR #{pr.get('pr_number', 'unknown')}: {e}")
@@ -214,11 +393,9 @@ class CSVReporter:
         if not text:
             return ""
         
-        # Replace newlines and tabs with spaces
-        sanitized = str(text).replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-        
-        # Remove excessive whitespace
-        sanitized = ' '.join(sanitized.split())
+        # Collapse newlines, tabs and runs of whitespace into single spaces;
+        # str.split() with no separator already splits on all of them
+        sanitized = ' '.join(str(text).split())
         
         # Truncate very long titles
         if len(sanitized) > 200:
@@ -239,18 +416,7 @@ class CSVReporter:
         if not datetime_str:
             return ""
         
-        try:
-            # Parse and reformat to ensure consistent format
-            if datetime_str.endswith('Z'):
-                datetime_str = datetime_str.replace('Z', '+00:00')
-            
-            dt = datetime.fromisoformat(datetime_str)
-            # Format as YYYY-MM-DD HH:MM:SS UTC
-            return dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-            
-        except (ValueError, TypeError):
-            # Return original string if parsing fails
-            return str(datetime_str)
+        return _format_datetime_cached(datetime_str)
     
     def _format_number(self, number: Optional[float]) -> str:
         """
@@ -276,8 +442,12 @@ class CSVReporter:
         Get the output file path.
         
         Returns:
-            Output file path as string
+            Output file path as string (the stream's name, if any, when
+            writing to a stream)
         """
+        if self._stream is not None:
+            return str(getattr(self._stream, 'name', '<stream>'))
+        
         return str(self.output_path)
     
     def generate_reviewer_report(self, reviewer_summary: Dict[str, Any]) -> str:
@@ -306,28 +476,37 @@ class CSVReporter:
         distribution_analysis = reviewer_summary.get('distribution_analysis', {})
         
         try:
-            # Generate reviewer CSV headers
-            headers = self._format_reviewer_csv_headers()
+            # Reviewer CSV rows are streamed straight into the writer
+            rows = self._iter_reviewer_csv_rows(reviewer_data, overload_analysis)
             
-            # Format reviewer CSV rows
-            rows = self._format_reviewer_csv_rows(reviewer_data, overload_analysis)
+            # Build reviewer summary information as comment lines
+            header_lines = self._format_reviewer_summary_header(metadata, statistics, distribution_analysis)
             
-            # Write CSV file
-            with open(self.output_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # Write reviewer summary information as comments
-                self._write_reviewer_summary_header(writer, metadata, statistics, distribution_analysis)
-                
-                # Write headers
-                writer.writerow(headers)
-                
-                # Write data rows
-                writer.writerows(rows)
+            # Render the whole report in memory so it reaches the file in one write
+            buffer = io.StringIO(newline='')
+            writer = csv.writer(buffer, dialect='pr_analyzer')
+            
+            # Summary comments as one-cell rows, then a blank separator line
+            writer.writerows([line] for line in header_lines)
+            writer.writerow([])
             
-            self.logger.info(f"Generated reviewer CSV report with {len(reviewer_data)} reviewers at {self.output_path}")
+            # Headers
+            writer.writerow(REVIEWER_CSV_HEADERS)
             
-            return str(self.output_path)
+            # Data rows
+            writer.writerows(rows)
+            
+            # Write CSV file in a single call. Encoding up front and writing
+            # bytes skips newline translation, like newline='' would
+            # (Path.write_text only accepts newline= on Python 3.10+)
+            if self._stream is not None:
+                self._stream.write(buffer.getvalue())
+            else:
+                self.output_path.write_bytes(buffer.getvalue().encode('utf-8'))
+            
+            self.logger.info(f"Generated reviewer CSV report with {len(reviewer_data)} reviewers at {self.get_output_path()}")
+            
+            return self.get_output_path()
             
         except Exception as e:
             raise CSVReportError(f"Failed to generate reviewer CSV report: {e}")
@@ -339,20 +518,7 @@ class CSVReporter:
         Returns:
             List of CSV column headers for reviewer data
         """
-        return [
-            'reviewer_login',
-            'reviewer_name',
-            'reviewer_type',
-            'total_requests',
-            'pr_numbers',
-            'request_sources',
-            'first_request_date',
-            'last_request_date',
-            'avg_requests_per_month',
-            'percentage_of_total',
-            'workload_status',
-            'workload_category'
-        ]
+        return list(REVIEWER_CSV_HEADERS)
     
     def _format_reviewer_csv_rows(self, reviewer_data: Dict[str, Dict[str, Any]], 
                                   overload_analysis: Dict[str, List[str]]) -> List[List[str]]:
@@ -366,90 +532,118 @@ class CSVReporter:
         Returns:
             List of CSV data rows
         """
+        return list(self._iter_reviewer_csv_rows(reviewer_data, overload_analysis))
+    
+    def _iter_reviewer_csv_rows(self, reviewer_data: Dict[str, Dict[str, Any]],
+                                overload_analysis: Dict[str, List[str]]) -> Iterator[List[str]]:
+        """
+        Yield reviewer data rows for CSV output, busiest reviewers first.
+        
+        Args:
+            reviewer_data: Dictionary of reviewer request data
+            overload_analysis: Dictionary containing overload categorization
+            
+        Yields:
+            CSV data rows
+        """
         if not reviewer_data:
-            return []
+            return
         
-        rows = []
-        total_requests = sum(data.get('total_requests', 0) for data in reviewer_data.values())
+        # Order reviewers by total requests (descending) before formatting so
+        # the sort compares the raw counts rather than re-parsing the CSV column
+        entries = [(data.get('total_requests', 0), login, data) for login, data in reviewer_data.items()]
+        entries.sort(key=itemgetter(0), reverse=True)
+        
+        # Percentage contributed by each request, computed once for all rows
+        total_requests = sum(entry[0] for entry in entries)
+        percent_per_request = 100.0 / total_requests if total_requests > 0 else 0.0
         
         # Create lookup for workload status
-        workload_status = {}
-        for status, reviewers in overload_analysis.items():
-            for reviewer in reviewers:
-                workload_status[reviewer] = status
+        workload_status = {reviewer: status
+                           for status, reviewers in overload_analysis.items()
+                           for reviewer in reviewers}
         
         # Calculate months for average calculation (estimate from date range)
         months_analyzed = 1  # Default to 1 month if we can't determine
         
-        for login, data in reviewer_data.items():
+        # Resolve formatters once rather than per cell
+        format_datetime = self._format_datetime
+        format_number = self._format_number
+        
+        for requests, login, data in entries:
             try:
-                requests = data.get('total_requests', 0)
-                
                 # Calculate average requests per month
                 avg_per_month = requests / months_analyzed
                 
                 # Calculate percentage of total requests
-                percentage = (requests / total_requests * 100) if total_requests > 0 else 0.0
+                percentage = requests * percent_per_request
                 
                 # Determine reviewer type (individual or team)
                 reviewer_type = 'team' if login.startswith('team:') else 'user'
                 
                 # Format PR numbers list
-                pr_numbers_str = ', '.join(str(pr) for pr in data.get('pr_numbers', []))
+                pr_numbers_str = ', '.join(map(str, data.get('pr_numbers', ())))
                 
                 # Format request sources
-                sources_str = ', '.join(data.get('request_sources', []))
+                sources_str = self._format_request_sources(data.get('request_sources'))
                 
-                # Get workload status
+                # Get workload status and its category
                 status = workload_status.get(login, 'NORMAL')
+                category = _WORKLOAD_CATEGORIES.get(status, 'Normal Load')
                 
-                # Determine workload category based on status
-                if status == 'OVERLOADED':
-                    category = 'Overloaded'
-                elif status == 'HIGH':
-                    category = 'High Load'
-                else:
-                    category = 'Normal Load'
-                
-                row = [
-                    str(login),
+                yield [
+                    login,
                     self._sanitize_text(data.get('name', login)),
                     reviewer_type,
-                    str(requests),
+                    f"{requests}",
                     pr_numbers_str,
                     sources_str,
-                    self._format_datetime(data.get('first_request_date')),
-                    self._format_datetime(data.get('last_request_date')),
-                    self._format_number(avg_per_month),
-                    self._format_number(percentage),
+                    format_datetime(data.get('first_request_date')),
+                    format_datetime(data.get('last_request_date')),
+                    format_number(avg_per_month),
+                    format_number(percentage),
                     status,
                     category
                 ]
                 
-                rows.append(row)
-                
             except Exception as e:
                 self.logger.warning(f"Failed to format reviewer {login}: {e}")
                 continue
+    
+    def _format_request_sources(self, request_sources: Any) -> str:
+        """
+        Format reviewer request sources for CSV output.
         
-        # Sort rows by total requests (descending)
-        rows.sort(key=lambda x: int(x[3]) if x[3].isdigit() else 0, reverse=True)
+        Args:
+            request_sources: Mapping of source to request count, or a list of
+                             source strings (one entry per request)
+            
+        Returns:
+            Formatted string such as "individual (3), team:core (1)"
+        """
+        if not request_sources:
+            return ""
         
-        return rows
+        if not isinstance(request_sources, dict):
+            request_sources = Counter(request_sources)
+        
+        return ', '.join(f"{source} ({count})" for source, count in request_sources.items())
     
-    def _write_reviewer_summary_header(self, writer: csv.writer, metadata: Dict[str, Any], 
-                                     statistics: Dict[str, Any], distribution: Dict[str, Any]) -> None:
+    def _format_reviewer_summary_header(self, metadata: Dict[str, Any], statistics: Dict[str, Any],
+                                        distribution: Dict[str, Any]) -> List[str]:
         """
-        Write reviewer analysis summary information as CSV comments.
+        Build reviewer analysis summary information as CSV comment lines.
         
         Args:
-            writer: CSV writer instance
             metadata: Analysis metadata dictionary
             statistics: Statistical summary dictionary
             distribution: Distribution analysis dictionary
+            
+        Returns:
+            Comment lines, without line terminators
         """
-        # Write header information
-        writer.writerow([f"# GitHub PR Reviewer Workload Analysis Report - Generated {datetime.now().isoformat()}"])
+        # Header information
+        lines = [f"# GitHub PR Reviewer Workload Analysis Report - Generated {datetime.now().isoformat()}"]
         
         # Metadata information
         if metadata:
@@ -458,11 +652,11 @@ class CSVReporter:
             include_teams = metadata.get('include_teams', False)
             org_name = metadata.get('org_name', 'N/A')
             
-            writer.writerow([f"# Total PRs Analyzed: {total_prs}"])
-            writer.writerow([f"# Overload Threshold: {threshold} requests"])
-            writer.writerow([f"# Team Analysis Enabled: {include_teams}"])
+            lines.append(f"# Total PRs Analyzed: {total_prs}")
+            lines.append(f"# Overload Threshold: {threshold} requests")
+            lines.append(f"# Team Analysis Enabled: {include_teams}")
             if include_teams:
-                writer.writerow([f"# Organization: {org_name}"])
+                lines.append(f"# Organization: {org_name}")
         
         # Statistical summary
         if statistics:
@@ -471,10 +665,10 @@ class CSVReporter:
             mean_requests = statistics.get('mean_requests', 0)
             median_requests = statistics.get('median_requests', 0)
             
-            writer.writerow([f"# Total Reviewers: {total_reviewers}"])
-            writer.writerow([f"# Total Review Requests: {total_requests}"])
-            writer.writerow([f"# Average Requests per Reviewer: {mean_requests:.2f}"])
-            writer.writerow([f"# Median Requests per Reviewer: {median_requests:.2f}"])
+            lines.append(f"# Total Reviewers: {total_reviewers}")
+            lines.append(f"# Total Review Requests: {total_requests}")
+            lines.append(f"# Average Requests per Reviewer: {mean_requests:.2f}")
+            lines.append(f"# Median Requests per Reviewer: {median_requests:.2f}")
         
         # Distribution insights
         if distribution:
@@ -482,16 +676,19 @@ class CSVReporter:
             gini = distribution.get('gini_coefficient', 0)
             diversity = distribution.get('reviewer_diversity_score', 0)
             
-            writer.writerow([f"# Top 20% Reviewers Handle: {concentration:.1%} of requests"])
-            writer.writerow([f"# Gini Coefficient (inequality): {gini:.3f}"])
-            writer.writerow([f"# Diversity Score: {diversity:.3f}"])
+            lines.append(f"# Top 20% Reviewers Handle: {concentration:.1%} of requests")
+            lines.append(f"# Gini Coefficient (inequality): {gini:.3f}")
+            lines.append(f"# Diversity Score: {diversity:.3f}")
         
-        writer.writerow([])  # Empty line before headers
+        return lines
     
-    def validate_analysis_results(self, analysis_results: Dict[str, Any]) -> bool:
+    @staticmethod
+    def validate_analysis_results(analysis_results: Dict[str, Any]) -> bool:
         """
         Validate analysis results structure for CSV generation.
         
+        Needs no output path, so it can be called on the class directly.
+        
         Args:
             analysis_results: Analysis results dictionary to validate
             
@@ -511,15 +708,15 @@ class CSVReporter:
         if not isinstance(pr_details, list):
             raise CSVReportError("'pr_details' must be a list")
         
-        # Validate required fields in each PR detail
-        required_fields = ['pr_number', 'repository_name', 'pr_creator_github_id', 'pr_creator_login']
+        # Validate required fields in each PR detail with one subset test per PR;
+        # only on failure work out which field to report
         for i, pr in enumerate(pr_details):
             if not isinstance(pr, dict):
                 raise CSVReportError(f"PR detail at index {i} must be a dictionary")
             
-            for field in required_fields:
-                if field not in pr:
-                    raise CSVReportError(f"PR detail at index {i} missing required field: {field}")
+            if not pr.keys() >= _REQUIRED_PR_FIELD_SET:
+                field = next(field for field in _REQUIRED_PR_FIELDS if field not in pr)
+                raise CSVReportError(f"PR detail at index {i} missing required field: {field}")
         
         return True
     
@@ -539,25 +736,26 @@ class CSVReporter:
         if not isinstance(reviewer_summary, dict):
             raise CSVReportError("Reviewer summary must be a dictionary")
         
-        # Check for required top-level keys
-        required_keys = ['reviewer_data', 'metadata', 'statistics', 'overload_analysis']
-        for key in required_keys:
-            if key not in reviewer_summary:
-                raise CSVReportError(f"Reviewer summary must contain '{key}' key")
+        # Check for required top-level keys, reporting every missing key at once
+        if not reviewer_summary.keys() >= _REQUIRED_SUMMARY_KEY_SET:
+            missing = [key for key in _REQUIRED_SUMMARY_KEYS if key not in reviewer_summary]
+            message = f"Reviewer summary must contain '{missing[0]}' key"
+            if len(missing) > 1:
+                message += " (also missing: " + ", ".join(f"'{key}'" for key in missing[1:]) + ")"
+            raise CSVReportError(message)
         
         reviewer_data = reviewer_summary['reviewer_data']
         if not isinstance(reviewer_data, dict):
             raise CSVReportError("'reviewer_data' must be a dictionary")
         
         # Validate required fields in each reviewer entry
-        required_reviewer_fields = ['login', 'total_requests', 'pr_numbers']
         for login, data in reviewer_data.items():
             if not isinstance(data, dict):
                 raise CSVReportError(f"Reviewer data for '{login}' must be a dictionary")
             
-            for field in required_reviewer_fields:
-                if field not in data:
-                    raise CSVReportError(f"Reviewer data for '{login}' missing required field: {field}")
+            if not data.keys() >= _REQUIRED_REVIEWER_FIELD_SET:
+                field = next(field for field in _REQUIRED_REVIEWER_FIELDS if field not in data)
+                raise CSVReportError(f"Reviewer data for '{login}' missing required field: {field}")
         
         # Validate metadata structure
         metadata = reviewer_summary['metadata']
@@ -680,7 +878,7 @@ class CSVReporter:
             
             # Append to CSV (create with headers if new)
             with open(tracking_path, 'a', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
+                writer = csv.writer(csvfile, dialect='pr_analyzer')
                 
                 if not file_exists:
                     writer.writerow(headers)
@@ -741,12 +939,11 @@ class CSVReporter:
                 for reviewer in reviewers:
                     workload_status[reviewer] = status
             
-            # Sort reviewers by request count (descending) and take top N
-            sorted_reviewers = sorted(
-                reviewer_data.items(),
-                key=lambda x: x[1].get('total_requests', 0),
-                reverse=True
-            )[:top_n]
+            # Sort reviewers by request count (descending) and take top N; the
+            # count is read once per reviewer and carried with the login
+            entries = [(data.get('total_requests', 0), login) for login, data in reviewer_data.items()]
+            entries.sort(key=itemgetter(0), reverse=True)
+            top_entries = entries[:top_n]
             
             # Check if file exists to determine if we need headers
             file_exists = tracking_path.exists()
@@ -756,8 +953,7 @@ class CSVReporter:
             
             # Build rows for each reviewer
             rows = []
-            for reviewer_login, data in sorted_reviewers:
-                requests = data.get('total_requests', 0)
+            for requests, reviewer_login in top_entries:
                 status = workload_status.get(reviewer_login, 'NORMAL')
                 percentage = (requests / total_requests * 100) if total_requests > 0 else 0.0
                 
@@ -772,7 +968,7 @@ class CSVReporter:
             
             # Append to CSV (create with headers if new)
             with open(tracking_path, 'a', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
+                writer = csv.writer(csvfile, dialect='pr_analyzer')
                 
                 if not file_exists:
                     writer.writerow(headers)
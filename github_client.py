@@ -6,11 +6,42 @@ to fetch pull request data, reviews, and related information.
 """
 
 import os
+import json
 import logging
+import re
 import requests
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding of API responses
+    orjson = None
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """Decode a response body with orjson when available, else via response.json()."""
+    content = getattr(response, 'content', None)
+    if orjson is not None and isinstance(content, bytes) and content:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let requests raise its own decode error so callers see the usual exception
+            pass
+    return response.json()
+
+
+def _decode_body(body: bytes) -> Any:
+    """Decode a JSON body that already decoded once, such as a cached response."""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+# Page number of the rel="last" entry in a GitHub Link header
+_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
 
 
 class GitHubAPIError(Exception):
@@ -38,12 +69,22 @@ class GitHubClient:
     
     BASE_URL = "https://api.github.com"
     
-    def __init__(self, token: str):
+    # Below this many remaining API requests, fan-outs run serially on the calling thread
+    CONCURRENCY_MIN_RATE_LIMIT = 100
+    
+    # Number of fan-out worker threads, bounding concurrent page requests once the last page is known
+    MAX_PAGE_FETCH_WORKERS = 8
+    
+    # Total size in bytes of the response bodies kept for conditional requests
+    ETAG_CACHE_MAX_BYTES = 4 * 1024 * 1024
+    
+    def __init__(self, token: str, clock: Optional[Callable[[], datetime]] = None):
         """
         Initialize GitHub client with authentication token.
         
         Args:
             token: GitHub personal access token for API authentication
+            clock: Callable returning the current time. Defaults to datetime.now
             
         Raises:
             GitHubAuthenticationError: If token is empty or None
@@ -52,6 +93,7 @@ class GitHubClient:
             raise GitHubAuthenticationError("GitHub token is required")
         
         self.token = token
+        self._clock = clock if clock is not None else datetime.now
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization': f'token {token}',
@@ -59,6 +101,22 @@ class GitHubClient:
             'User-Agent': 'GitHub-PR-Analyzer/1.0'
         })
         
+        # Last X-RateLimit-Remaining seen, used to decide whether fan-outs may run concurrently
+        self._rate_limit_remaining = None
+        # Worker threads in a fan-out keep their own Session here
+        self._thread_local = threading.local()
+        # Fan-out workers are started on first use and kept for the client's lifetime,
+        # so each worker's Session keeps its connections open between fan-outs
+        self._executor = None
+        self._worker_sessions = []
+        self._executor_lock = threading.Lock()
+        
+        # (url, params) -> (ETag, raw body) for conditional requests, least recently used first.
+        # Raw bytes are kept so every cache hit decodes a fresh copy callers can safely mutate.
+        self._etag_cache = OrderedDict()
+        self._etag_cache_bytes = 0
+        self._etag_lock = threading.Lock()
+        
         # Configure logging
         self.logger = logging.getLogger(__name__)
     
@@ -185,6 +243,8 @@ class GitHubClient:
         # Handle rate limit exceeded - only treat as rate limit if headers are actually present
         # If no rate limit headers are present, this is a regular 403 Forbidden, not a rate limit
         has_rate_limit_headers = 'X-RateLimit-Remaining' in response.headers
+        if has_rate_limit_headers:
+            self._rate_limit_remaining = rate_info['remaining']
         if response.status_code == 403 and has_rate_limit_headers and rate_info['remaining'] == 0:
             wait_time = self._calculate_wait_time(rate_info['reset'])
             reset_time_str = datetime.fromtimestamp(rate_info['reset']).strftime('%Y-%m-%d %H:%M:%S')
@@ -209,6 +269,11 @@ class GitHubClient:
         """
         Make authenticated API request with retry logic and exponential backoff.
         
+        Responses carrying an ETag are cached, and repeat requests send it as
+        If-None-Match. GitHub answers unchanged resources with 304 Not Modified,
+        which does not count against the rate limit, and the cached body is
+        decoded again.
+        
         Args:
             url: API endpoint URL
             params: Query parameters for the request
@@ -223,15 +288,28 @@ class GitHubClient:
             GitHubRateLimitError: If rate limit is exceeded and cannot be handled
         """
         last_exception = None
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
         
         for attempt in range(max_retries + 1):
             try:
-                response = self.session.get(url, params=params)
+                session = self._request_session()
+                if cached:
+                    response = session.get(url, params=params, headers={'If-None-Match': cached[0]})
+                else:
+                    response = session.get(url, params=params)
                 
                 # Handle rate limiting
                 self._handle_rate_limit(response)
                 
-                if response.status_code == 401:
+                if response.status_code == 304 and cached:
+                    with self._etag_lock:
+                        if cache_key in self._etag_cache:
+                            self._etag_cache.move_to_end(cache_key)
+                    self.logger.debug("Not modified, using cached response for %s", url)
+                    return _decode_body(cached[1])
+                elif response.status_code == 401:
                     raise GitHubAuthenticationError("GitHub token is invalid or expired")
                 elif response.status_code != 200:
                     raise GitHubAPIError(f"API request failed: {response.status_code} - {response.text}")
@@ -239,7 +317,10 @@ class GitHubClient:
                 if attempt > 0:
                     self.logger.info(f"API request succeeded after {attempt} retries")
                 
-                return response.json()
+                data = _decode_json(response)
+                self._store_etag(cache_key, response)
+                
+                return data
                 
             except GitHubRateLimitError:
                 # Don't retry rate limit errors, let them bubble up
@@ -265,6 +346,108 @@ class GitHubClient:
         # If we get here, all retries failed
         raise GitHubAPIError(f"GitHub API request to {url} failed after {max_retries + 1} attempts: {last_exception}")
     
+    def _request_session(self) -> requests.Session:
+        """Return the calling worker thread's own Session inside a fan-out, else the shared one."""
+        return getattr(self._thread_local, 'session', None) or self.session
+    
+    @staticmethod
+    def _init_worker_session(thread_local: threading.local, headers: Dict[str, str],
+                             sessions: List[requests.Session], lock: threading.Lock) -> None:
+        """Give a new fan-out worker thread its own Session with the client's headers."""
+        session = requests.Session()
+        session.headers.update(headers)
+        with lock:
+            sessions.append(session)
+        thread_local.session = session
+    
+    def _worker_executor(self) -> ThreadPoolExecutor:
+        """Return the client's fan-out worker pool, starting it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                # The initializer is given the pieces it needs rather than self, so
+                # idle workers don't keep the client alive
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_PAGE_FETCH_WORKERS,
+                    initializer=self._init_worker_session,
+                    initargs=(self._thread_local, dict(self.session.headers),
+                              self._worker_sessions, self._executor_lock)
+                )
+            return self._executor
+    
+    def _run_concurrently(self, fn: Callable[[Any], Any], items: List[Any]) -> List[Future]:
+        """
+        Call fn on each item, concurrently when the rate limit allows.
+        
+        Items run on the client's worker pool, where each worker thread keeps
+        its own requests.Session (Session is not documented to be thread-safe)
+        for the client's lifetime. When the last seen X-RateLimit-Remaining is
+        below CONCURRENCY_MIN_RATE_LIMIT, items run serially on the calling thread
+        so a nearly exhausted limit isn't hit, and backed off from, by many
+        workers at once. Fan-outs started from a worker thread also run serially,
+        as waiting on the pool from inside it could deadlock.
+        
+        Args:
+            fn: Callable taking a single item
+            items: Items to process
+            
+        Returns:
+            One completed Future per item, in item order
+        """
+        remaining = self._rate_limit_remaining
+        low_rate_limit = remaining is not None and remaining < self.CONCURRENCY_MIN_RATE_LIMIT
+        on_worker = getattr(self._thread_local, 'session', None) is not None
+        
+        if len(items) <= 1 or low_rate_limit or on_worker:
+            futures = []
+            for item in items:
+                future = Future()
+                try:
+                    future.set_result(fn(item))
+                except Exception as e:
+                    future.set_exception(e)
+                futures.append(future)
+            return futures
+        
+        executor = self._worker_executor()
+        futures = [executor.submit(fn, item) for item in items]
+        for future in futures:
+            future.exception()
+        
+        return futures
+    
+    def _shutdown_workers(self) -> None:
+        """Stop the fan-out worker pool, if started, and close the workers' Sessions."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._executor_lock:
+            sessions, self._worker_sessions[:] = list(self._worker_sessions), []
+        for session in sessions:
+            session.close()
+    
+    def close(self) -> None:
+        """Release the client's HTTP connections and fan-out worker threads."""
+        self._shutdown_workers()
+        self.session.close()
+    
+    def _store_etag(self, cache_key: tuple, response: requests.Response) -> None:
+        """Cache a response body under its ETag, evicting least recently used entries past the byte budget."""
+        etag = response.headers.get('ETag')
+        body = getattr(response, 'content', None)
+        if not etag or not isinstance(body, bytes) or len(body) > self.ETAG_CACHE_MAX_BYTES:
+            return
+        
+        with self._etag_lock:
+            previous = self._etag_cache.pop(cache_key, None)
+            if previous is not None:
+                self._etag_cache_bytes -= len(previous[1])
+            self._etag_cache[cache_key] = (etag, body)
+            self._etag_cache_bytes += len(body)
+            while self._etag_cache_bytes > self.ETAG_CACHE_MAX_BYTES:
+                _, (_, evicted) = self._etag_cache.popitem(last=False)
+                self._etag_cache_bytes -= len(evicted)
+    
     def get_pr_data_batch(self, owner: str, repo: str, pr_numbers: List[int], 
                          batch_size: int = 10, delay_between_batches: float = 0.1) -> Dict[int, Dict[str, Any]]:
         """
@@ -427,7 +610,8 @@ class GitHubClient:
             self.logger.warning(f"Failed to get username for user ID {user_id}: {e}")
             return None
     
-    def get_pull_requests(self, owner: str, repo: str, since_date: datetime, state: str = "all") -> List[Dict[str, Any]]:
+    def get_pull_requests(self, owner: str, repo: str, since_date: datetime, state: str = "all",
+                          per_page: int = 100) -> List[Dict[str, Any]]:
         """
         Fetch pull requests from a repository since a specific date.
         
@@ -436,6 +620,7 @@ class GitHubClient:
             repo: Repository name
             since_date: Fetch PRs created since this date
             state: PR state filter (open, closed, all). Defaults to 'all'
+            per_page: Number of PRs requested per page. Defaults to 100 (the API maximum)
             
         Returns:
             List of pull request data dictionaries
@@ -445,7 +630,6 @@ class GitHubClient:
         """
         all_prs = []
         page = 1
-        per_page = 100
         
         self.logger.info(f"Fetching pull requests from {owner}/{repo} since {since_date}")
         
@@ -547,7 +731,7 @@ class GitHubClient:
         """
         from dateutil.relativedelta import relativedelta
         
-        now = datetime.now().replace(microsecond=0)
+        now = self._clock().replace(microsecond=0)
         start_date = now - relativedelta(months=months_back)
         
         self.logger.debug(f"Calculated date range: {start_date} to {now} ({months_back} month(s) back)")
@@ -609,7 +793,8 @@ class GitHubClient:
                 return []
             raise
     
-    def get_pr_timeline(self, owner: str, repo: str, pr_number: int) -> List[Dict[str, Any]]:
+    def get_pr_timeline(self, owner: str, repo: str, pr_number: int,
+                        per_page: int = 100) -> List[Dict[str, Any]]:
         """
         Fetch the complete timeline of events for a pull request.
         
@@ -617,6 +802,7 @@ class GitHubClient:
             owner: Repository owner (user or organization)
             repo: Repository name
             pr_number: Pull request number
+            per_page: Number of events requested per page. Defaults to 100 (the API maximum)
             
         Returns:
             List of timeline event dictionaries
@@ -631,38 +817,45 @@ class GitHubClient:
         
         try:
             timeline = []
-            page = 1
-            per_page = 100
-            
-            while True:
-                params = {'per_page': per_page, 'page': page}
+            response = self._get_timeline_page(url, 1, per_page, headers)
+            last_page = self._get_last_page(response) if response is not None else 1
+            
+            if last_page > 1:
+                # The Link header names the last page, so request the remaining
+                # pages concurrently instead of one round trip at a time
+                futures = self._run_concurrently(
+                    lambda page: self._get_timeline_page(url, page, per_page, headers),
+                    list(range(2, last_page + 1))
+                )
+                responses = [response] + [future.result() for future in futures]
                 
-                # Make request with specific headers for timeline API
-                response = self.session.get(url, params=params, headers={**self.session.headers, **headers})
-                
-                # Handle response manually for this special case
-                self._handle_rate_limit(response)
-                
-                if response.status_code == 401:
-                    raise GitHubAuthenticationError("GitHub token is invalid or expired")
-                elif response.status_code == 404:
+                if any(page_response is None for page_response in responses):
                     self.logger.warning(f"PR #{pr_number} not found in {owner}/{repo}")
                     return []
-                elif response.status_code != 200:
-                    raise GitHubAPIError(f"Timeline API request failed: {response.status_code} - {response.text}")
                 
-                page_events = response.json()
+                for page_response in responses:
+                    timeline.extend(_decode_json(page_response))
+            else:
+                page = 1
                 
-                if not page_events:
-                    break
-                
-                timeline.extend(page_events)
-                
-                # If we got fewer events than requested per page, we've reached the end
-                if len(page_events) < per_page:
-                    break
-                
-                page += 1
+                while True:
+                    if response is None:
+                        self.logger.warning(f"PR #{pr_number} not found in {owner}/{repo}")
+                        return []
+                    
+                    page_events = _decode_json(response)
+                    
+                    if not page_events:
+                        break
+                    
+                    timeline.extend(page_events)
+                    
+                    # If we got fewer events than requested per page, we've reached the end
+                    if len(page_events) < per_page:
+                        break
+                    
+                    page += 1
+                    response = self._get_timeline_page(url, page, per_page, headers)
             
             self.logger.debug(f"Fetched {len(timeline)} timeline events for PR #{pr_number} in {owner}/{repo}")
             return timeline
@@ -672,6 +865,41 @@ class GitHubClient:
         except Exception as e:
             raise GitHubAPIError(f"Failed to fetch PR timeline: {e}")
     
+    def _get_timeline_page(self, url: str, page: int, per_page: int,
+                           headers: Dict[str, str]) -> Optional[requests.Response]:
+        """
+        Request one page of timeline events and check the response status.
+        
+        Returns:
+            The successful response, or None if the PR was not found (404)
+            
+        Raises:
+            GitHubAuthenticationError: If the token is invalid or expired
+            GitHubAPIError: If the request fails with any other status
+        """
+        params = {'per_page': per_page, 'page': page}
+        
+        # Make request with specific headers for timeline API
+        session = self._request_session()
+        response = session.get(url, params=params, headers={**session.headers, **headers})
+        
+        # Handle response manually for this special case
+        self._handle_rate_limit(response)
+        
+        if response.status_code == 401:
+            raise GitHubAuthenticationError("GitHub token is invalid or expired")
+        elif response.status_code == 404:
+            return None
+        elif response.status_code != 200:
+            raise GitHubAPIError(f"Timeline API request failed: {response.status_code} - {response.text}")
+        
+        return response
+    
+    def _get_last_page(self, response: requests.Response) -> int:
+        """Return the last page number advertised in the Link header, or 1 if there is none."""
+        match = _LAST_PAGE_RE.search(response.headers.get('Link', ''))
+        return int(match.group(1)) if match else 1
+    
     def get_pr_merge_info(self, owner: str, repo: str, pr_number: int) -> Optional[Dict[str, Any]]:
         """
         Get merge information for a pull request if it has been merged.
@@ -711,7 +939,8 @@ class GitHubClient:
         except Exception as e:
             raise GitHubAPIError(f"Failed to fetch merge information: {e}")
     
-    def get_pr_commits(self, owner: str, repo: str, pr_number: int) -> List[Dict[str, Any]]:
+    def get_pr_commits(self, owner: str, repo: str, pr_number: int,
+                       per_page: int = 100) -> List[Dict[str, Any]]:
         """
         Fetch all commits in a pull request with their timestamps.
         
@@ -719,6 +948,7 @@ class GitHubClient:
             owner: Repository owner (user or organization)
             repo: Repository name
             pr_number: Pull request number
+            per_page: Number of commits requested per page. Defaults to 100 (the API maximum)
             
         Returns:
             List of commit data dictionaries with timestamps
@@ -731,7 +961,6 @@ class GitHubClient:
         try:
             commits = []
             page = 1
-            per_page = 100
             
             while True:
                 params = {'per_page': per_page, 'page': page}
@@ -855,7 +1084,8 @@ class GitHubClient:
             self.logger.warning("No organization provided for team expansion, skipping")
             return []
         
-        expanded_members = []
+        seen_ids = set()
+        unique_list = []
         
         for team in teams:
             team_slug = team.get('slug')
@@ -867,21 +1097,18 @@ class GitHubClient:
                 
             try:
                 members = self.get_team_members(org, team_slug)
-                expanded_members.extend(members)
+                # Remove duplicates based on user ID as each team is merged
+                for member in members:
+                    user_id = member.get('id')
+                    if user_id and user_id not in seen_ids:
+                        seen_ids.add(user_id)
+                        unique_list.append(member)
                 self.logger.debug(f"Expanded team '{team_name}' to {len(members)} members")
                 
             except Exception as e:
                 self.logger.warning(f"Failed to expand team '{team_name}': {e}")
                 continue
         
-        # Remove duplicates based on user ID
-        unique_members = {}
-        for member in expanded_members:
-            user_id = member.get('id')
-            if user_id and user_id not in unique_members:
-                unique_members[user_id] = member
-        
-        unique_list = list(unique_members.values())
         self.logger.debug(f"Team expansion resulted in {len(unique_list)} unique members from {len(teams)} teams")
         
         return unique_list
@@ -907,16 +1134,18 @@ class GitHubClient:
         # Extract requested reviewers (individual users)
         requested_users = pr_data.get('requested_reviewers', [])
         if not isinstance(requested_users, list):
-            self.logger.warning(f"PR #{pr_number}: requested_reviewers is not a list, treating as empty")
+            self.logger.warning("PR #%s: requested_reviewers is not a list, treating as empty", pr_number)
             requested_users = []
         
         # Extract requested teams
         requested_teams = pr_data.get('requested_teams', [])
         if not isinstance(requested_teams, list):
-            self.logger.warning(f"PR #{pr_number}: requested_teams is not a list, treating as empty")
+            self.logger.warning("PR #%s: requested_teams is not a list, treating as empty", pr_number)
             requested_teams = []
         
-        self.logger.debug(f"PR #{pr_number}: Found {len(requested_users)} user reviewers and {len(requested_teams)} team reviewers")
+        # %-style arguments so the message is only formatted when debug logging is on; this runs once per PR
+        self.logger.debug("PR #%s: Found %d user reviewers and %d team reviewers",
+                          pr_number, len(requested_users), len(requested_teams))
         
         return {
             'users': requested_users,
@@ -179,14 +179,14 @@ class PRAnalyzer:
                         if until_date is not None:
                             if pr_created < until_date:
                                 filtered_prs.append(pr)
-                                self.logger.debug(f"Included PR #{pr.get('number')} created at {pr_created}")
+                                self.logger.debug("Included PR #%s created at %s", pr.get('number'), pr_created)
                             else:
-                                self.logger.debug(f"Filtered out PR #{pr.get('number')} created at {pr_created} (after {until_date})")
+                                self.logger.debug("Filtered out PR #%s created at %s (after %s)", pr.get('number'), pr_created, until_date)
                         else:
                             filtered_prs.append(pr)
-                            self.logger.debug(f"Included PR #{pr.get('number')} created at {pr_created}")
+                            self.logger.debug("Included PR #%s created at %s", pr.get('number'), pr_created)
                     else:
-                        self.logger.debug(f"Filtered out PR #{pr.get('number')} created at {pr_created} (before {since_date})")
+                        self.logger.debug("Filtered out PR #%s created at %s (before %s)", pr.get('number'), pr_created, since_date)
                         
                 except ValueError as e:
                     self.logger.warning(f"Failed to parse date for PR #{pr.get('number', 'unknown')}: {e}")
@@ -338,7 +338,7 @@ class PRAnalyzer:
                 if missing_fields:
                     self.logger.warning(f"PR #{pr_number} missing required fields: {missing_fields}")
                 
-                self.logger.debug(f"Analyzing PR #{pr_number}")
+                self.logger.debug("Analyzing PR #%s", pr_number)
                 
                 # Initialize default values for API data
                 reviews = []
@@ -454,7 +454,7 @@ class PRAnalyzer:
             first_review = self._get_first_review_activity(activities)
             
             if not first_review:
-                self.logger.debug(f"No review activity found for PR #{pr.get('number')}")
+                self.logger.debug("No review activity found for PR #%s", pr.get('number'))
                 return None
             
             # Parse first review time
@@ -473,7 +473,7 @@ class PRAnalyzer:
             time_diff = review_time - pr_created
             hours = time_diff.total_seconds() / 3600
             
-            self.logger.debug(f"PR #{pr.get('number')} first review after {hours:.2f} hours")
+            self.logger.debug("PR #%s first review after %.2f hours", pr.get('number'), hours)
             
             return round(hours, 2)
             
@@ -521,7 +521,7 @@ class PRAnalyzer:
             time_diff = merged_at - pr_created
             hours = time_diff.total_seconds() / 3600
             
-            self.logger.debug(f"PR #{pr.get('number')} merged after {hours:.2f} hours")
+            self.logger.debug("PR #%s merged after %.2f hours", pr.get('number'), hours)
             
             return round(hours, 2)
             
@@ -567,7 +567,7 @@ class PRAnalyzer:
             time_diff = merged_at - first_commit_time
             hours = time_diff.total_seconds() / 3600
             
-            self.logger.debug(f"PR #{pr.get('number')} commit lead time: {hours:.2f} hours")
+            self.logger.debug("PR #%s commit lead time: %.2f hours", pr.get('number'), hours)
             
             return round(hours, 2)
             
@@ -719,7 +719,7 @@ class PRAnalyzer:
                     self.logger.warning(f"PR #{pr_number} has non-numeric GitHub ID: {github_id} ({e})")
                     github_id_str = ''
             else:
-                self.logger.info(f"PR #{pr_number} missing GitHub user ID")
+                self.logger.info("PR #%s missing GitHub user ID", pr_number)
             
             # Extract login with validation
             login = user_data.get('login', '')
@@ -731,11 +731,11 @@ class PRAnalyzer:
             if not github_id_str and not login:
                 self.logger.warning(f"PR #{pr_number} has user object but missing both ID and login")
             elif not github_id_str:
-                self.logger.info(f"PR #{pr_number} missing GitHub ID but has login: {login}")
+                self.logger.info("PR #%s missing GitHub ID but has login: %s", pr_number, login)
             elif not login:
-                self.logger.info(f"PR #{pr_number} missing login but has GitHub ID: {github_id_str}")
+                self.logger.info("PR #%s missing login but has GitHub ID: %s", pr_number, github_id_str)
             else:
-                self.logger.debug(f"PR #{pr_number} created by user {login} (ID: {github_id_str})")
+                self.logger.debug("PR #%s created by user %s (ID: %s)", pr_number, login, github_id_str)
             
             return github_id_str, login
             
@@ -756,41 +756,49 @@ class PRAnalyzer:
         if not analysis:
             return {'summary': {'total_prs_analyzed': 0}, 'pr_details': []}
         
-        # Add summary statistics to the results
+        # Collect counts and metric sums in a single pass over the results
         total_prs = len(analysis)
-        merged_prs = [pr for pr in analysis if pr['is_merged']]
-        reviewed_prs = [pr for pr in analysis if pr['has_reviews']]
+        merged_count = 0
+        reviewed_count = 0
+        review_sum, review_n = 0.0, 0
+        merge_sum, merge_n = 0.0, 0
+        lead_sum, lead_n = 0.0, 0
+        
+        for pr in analysis:
+            if pr['is_merged']:
+                merged_count += 1
+            if pr['has_reviews']:
+                reviewed_count += 1
+            
+            review_time = pr['time_to_first_review_hours']
+            if review_time is not None:
+                review_sum += review_time
+                review_n += 1
+            
+            merge_time = pr['time_to_merge_hours']
+            if merge_time is not None:
+                merge_sum += merge_time
+                merge_n += 1
+            
+            lead_time = pr['commit_lead_time_hours']
+            if lead_time is not None:
+                lead_sum += lead_time
+                lead_n += 1
         
         # Extract repository name from first PR (all should have same repo)
-        repository_name = analysis[0].get('repository_name', '') if analysis else ''
+        repository_name = analysis[0].get('repository_name', '')
         
         summary_stats = {
             'total_prs_analyzed': total_prs,
-            'merged_prs': len(merged_prs),
-            'reviewed_prs': len(reviewed_prs),
+            'merged_prs': merged_count,
+            'reviewed_prs': reviewed_count,
             'repository_name': repository_name,
-            'avg_time_to_first_review': None,
-            'avg_time_to_merge': None,
-            'avg_commit_lead_time': None
+            'avg_time_to_first_review': round(review_sum / review_n, 2) if review_n else None,
+            'avg_time_to_merge': round(merge_sum / merge_n, 2) if merge_n else None,
+            'avg_commit_lead_time': round(lead_sum / lead_n, 2) if lead_n else None
         }
         
-        # Calculate averages for PRs with data
-        review_times = [pr['time_to_first_review_hours'] for pr in analysis 
-                       if pr['time_to_first_review_hours'] is not None]
-        if review_times:
-            summary_stats['avg_time_to_first_review'] = round(sum(review_times) / len(review_times), 2)
-        
-        merge_times = [pr['time_to_merge_hours'] for pr in analysis 
-                      if pr['time_to_merge_hours'] is not None]
-        if merge_times:
-            summary_stats['avg_time_to_merge'] = round(sum(merge_times) / len(merge_times), 2)
-        
-        lead_times = [pr['commit_lead_time_hours'] for pr in analysis 
-                     if pr['commit_lead_time_hours'] is not None]
-        if lead_times:
-            summary_stats['avg_commit_lead_time'] = round(sum(lead_times) / len(lead_times), 2)
-        
-        self.logger.info(f"Analysis complete: {total_prs} PRs, {len(merged_prs)} merged, {len(reviewed_prs)} reviewed")
+        self.logger.info(f"Analysis complete: {total_prs} PRs, {merged_count} merged, {reviewed_count} reviewed")
         
         return {
             'summary': summary_stats,
@@ -7,10 +7,87 @@ reviewer request distribution patterns.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict, Counter
+from collections import Counter
 import statistics
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+
+@lru_cache(maxsize=4096)
+def _fast_iso_epoch(timestamp: str) -> float:
+    """
+    Convert an ISO-8601 timestamp to a UTC epoch in seconds.
+    
+    GitHub timestamps are always 'YYYY-MM-DDTHH:MM:SSZ', so that shape is parsed
+    by slicing; anything else falls back to datetime.fromisoformat().
+    
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    if len(timestamp) == 20 and timestamp[19] == 'Z':
+        return datetime(
+            int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19]),
+            tzinfo=timezone.utc
+        ).timestamp()
+    
+    if timestamp.endswith('Z'):
+        timestamp = timestamp[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class _ReviewerAggregate:
+    """
+    Running request totals for a single reviewer during aggregation.
+    
+    Uses __slots__ to keep per-reviewer state compact; converted to the public
+    dictionary shape with to_dict() once aggregation is complete.
+    """
+    
+    __slots__ = ('login', 'name', 'total_requests', 'pr_numbers', 'request_sources',
+                 'first_request_date', 'last_request_date', 'first_ts', 'last_ts')
+    
+    def __init__(self, login: str, name: str):
+        self.login = login
+        self.name = name
+        self.total_requests = 0
+        self.pr_numbers = set()
+        self.request_sources = Counter()
+        self.first_request_date = None
+        self.last_request_date = None
+        self.first_ts = None
+        self.last_ts = None
+    
+    def add_request(self, pr_number: int, source: str, created_at: Optional[str],
+                    created_ts: Optional[float]) -> None:
+        """Record one review request from a PR, tracking the request date range."""
+        self.total_requests += 1
+        self.pr_numbers.add(pr_number)
+        self.request_sources[source] += 1
+        
+        if created_ts is not None:
+            if self.first_ts is None or created_ts < self.first_ts:
+                self.first_ts = created_ts
+                self.first_request_date = created_at
+            if self.last_ts is None or created_ts > self.last_ts:
+                self.last_ts = created_ts
+                self.last_request_date = created_at
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the reviewer data dictionary returned by the public API."""
+        return {
+            'login': self.login,
+            'name': self.name,
+            'total_requests': self.total_requests,
+            'pr_numbers': list(self.pr_numbers),
+            'request_sources': dict(self.request_sources),
+            'first_request_date': self.first_request_date,
+            'last_request_date': self.last_request_date
+        }
 
 
 class ReviewerWorkloadAnalyzer:
@@ -59,7 +136,7 @@ class ReviewerWorkloadAnalyzer:
                     'name': str,
                     'total_requests': int,
                     'pr_numbers': List[int],
-                    'request_sources': List[str],  # 'individual' or 'team:<team_name>'
+                    'request_sources': Dict[str, int],  # Request count per source ('individual' or 'team:<team_name>')
                     'first_request_date': str,
                     'last_request_date': str
                 }
@@ -69,18 +146,13 @@ class ReviewerWorkloadAnalyzer:
             self.logger.warning("No PRs provided for reviewer request aggregation")
             return {}
         
-        reviewer_requests = defaultdict(lambda: {
-            'login': '',
-            'name': '',
-            'total_requests': 0,
-            'pr_numbers': [],
-            'request_sources': [],
-            'first_request_date': None,
-            'last_request_date': None
-        })
-        
         self.logger.info(f"Aggregating reviewer requests from {len(prs)} PRs")
         
+        reviewer_requests = {}
+        # (login/source, display name) strings per team, built once per call; bounded by
+        # the teams seen in this aggregation rather than kept for the process lifetime
+        team_keys = {}
+        
         for pr in prs:
             pr_number = pr.get('number')
             pr_created_at = pr.get('created_at')
@@ -89,10 +161,25 @@ class ReviewerWorkloadAnalyzer:
                 self.logger.warning("PR missing number field, skipping")
                 continue
             
+            requested_reviewers = pr.get('requested_reviewers')
+            requested_teams = pr.get('requested_teams') if include_teams else None
+            
+            # Most PRs carry no pending review requests; skip them before any per-reviewer work
+            if not requested_reviewers and not requested_teams:
+                continue
+            
+            # Parse the creation date once per PR rather than once per reviewer
+            pr_created_ts = None
+            if pr_created_at:
+                try:
+                    pr_created_ts = _fast_iso_epoch(pr_created_at)
+                except (ValueError, TypeError):
+                    self.logger.warning("PR #%s has unparseable created_at: %s", pr_number, pr_created_at)
+            
             # Process requested_reviewers (individual users)
-            requested_reviewers = pr.get('requested_reviewers', [])
             if isinstance(requested_reviewers, list):
                 for reviewer in requested_reviewers:
+                    # Skip only the malformed entry so later reviewers on the PR still count
                     if not isinstance(reviewer, dict):
                         continue
                     
@@ -100,63 +187,47 @@ class ReviewerWorkloadAnalyzer:
                     if not login:
                         continue
                     
-                    # Update reviewer data
-                    reviewer_data = reviewer_requests[login]
-                    reviewer_data['login'] = login
-                    reviewer_data['name'] = reviewer.get('name') or reviewer.get('display_name') or login
-                    reviewer_data['total_requests'] += 1
-                    reviewer_data['pr_numbers'].append(pr_number)
-                    reviewer_data['request_sources'].append('individual')
-                    
-                    # Track date range
-                    if pr_created_at:
-                        if not reviewer_data['first_request_date'] or pr_created_at < reviewer_data['first_request_date']:
-                            reviewer_data['first_request_date'] = pr_created_at
-                        if not reviewer_data['last_request_date'] or pr_created_at > reviewer_data['last_request_date']:
-                            reviewer_data['last_request_date'] = pr_created_at
+                    aggregate = reviewer_requests.get(login)
+                    if aggregate is None:
+                        # First request for this reviewer; identity doesn't change afterwards
+                        name = reviewer.get('name') or reviewer.get('display_name') or login
+                        aggregate = reviewer_requests[login] = _ReviewerAggregate(login, name)
+                    aggregate.add_request(pr_number, 'individual', pr_created_at, pr_created_ts)
+            elif requested_reviewers:
+                self.logger.warning("PR #%s has malformed requested_reviewers data, skipping", pr_number)
             
             # Process requested_teams (if enabled)
-            if include_teams:
-                requested_teams = pr.get('requested_teams', [])
-                if isinstance(requested_teams, list):
-                    for team in requested_teams:
-                        if not isinstance(team, dict):
-                            continue
-                        
-                        team_name = team.get('name') or team.get('slug')
-                        if not team_name:
-                            continue
-                        
-                        # For team requests, we would need to expand to individual members
-                        # This is a simplified version - real implementation would use GitHubClient
-                        # to expand team members using expand_team_reviewers()
-                        
-                        # Note: In a real implementation, this would call:
-                        # github_client.expand_team_reviewers([team], org_name)
-                        # For now, we'll just track the team request as a placeholder
-                        
-                        team_login = f"team:{team_name}"
-                        reviewer_data = reviewer_requests[team_login]
-                        reviewer_data['login'] = team_login
-                        reviewer_data['name'] = f"Team: {team_name}"
-                        reviewer_data['total_requests'] += 1
-                        reviewer_data['pr_numbers'].append(pr_number)
-                        reviewer_data['request_sources'].append(f'team:{team_name}')
-                        
-                        # Track date range
-                        if pr_created_at:
-                            if not reviewer_data['first_request_date'] or pr_created_at < reviewer_data['first_request_date']:
-                                reviewer_data['first_request_date'] = pr_created_at
-                            if not reviewer_data['last_request_date'] or pr_created_at > reviewer_data['last_request_date']:
-                                reviewer_data['last_request_date'] = pr_created_at
-        
-        # Convert defaultdict to regular dict and clean up data
-        final_data = {}
-        for login, data in reviewer_requests.items():
-            if data['total_requests'] > 0:
-                # Remove duplicates from pr_numbers
-                data['pr_numbers'] = list(set(data['pr_numbers']))
-                final_data[login] = dict(data)
+            if isinstance(requested_teams, list):
+                for team in requested_teams:
+                    if not isinstance(team, dict):
+                        continue
+                    
+                    team_name = team.get('name') or team.get('slug')
+                    if not team_name:
+                        continue
+                    
+                    # For team requests, we would need to expand to individual members
+                    # This is a simplified version - real implementation would use GitHubClient
+                    # to expand team members using expand_team_reviewers()
+                    
+                    # Note: In a real implementation, this would call:
+                    # github_client.expand_team_reviewers([team], org_name)
+                    # For now, we'll just track the team request as a placeholder
+                    
+                    keys = team_keys.get(team_name)
+                    if keys is None:
+                        keys = team_keys[team_name] = (f"team:{team_name}", f"Team: {team_name}")
+                    team_login, team_display_name = keys
+                    
+                    aggregate = reviewer_requests.get(team_login)
+                    if aggregate is None:
+                        aggregate = reviewer_requests[team_login] = _ReviewerAggregate(team_login, team_display_name)
+                    aggregate.add_request(pr_number, team_login, pr_created_at, pr_created_ts)
+            elif requested_teams:
+                self.logger.warning("PR #%s has malformed requested_teams data, skipping", pr_number)
+        
+        # Clean up data for the public result
+        final_data = {login: aggregate.to_dict() for login, aggregate in reviewer_requests.items()}
         
         self.logger.info(f"Aggregated requests for {len(final_data)} reviewers")
         self._reviewer_data = final_data
@@ -180,7 +251,83 @@ class ReviewerWorkloadAnalyzer:
                 'NORMAL': List[str]       # Reviewers below 75% of threshold
             }
         """
-        if not reviewer_data:
+        ranked, request_counts = self._rank_reviewers(reviewer_data)
+        return self._overload_from_ranked(ranked, request_counts, threshold)
+    
+    def calculate_reviewer_statistics(self, reviewer_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Calculate statistical metrics for reviewer request distribution.
+        
+        Args:
+            reviewer_data: Aggregated reviewer request data
+            
+        Returns:
+            Dictionary containing statistical metrics:
+            {
+                'total_reviewers': int,
+                'total_requests': int,
+                'mean_requests': float,
+                'median_requests': float,
+                'std_dev_requests': float,
+                'min_requests': int,
+                'max_requests': int,
+                'percentile_75': float,
+                'percentile_90': float,
+                'percentile_95': float
+            }
+        """
+        _, request_counts = self._rank_reviewers(reviewer_data)
+        return self._statistics_from_counts(request_counts)
+    
+    def analyze_reviewer_distribution(self, reviewer_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Analyze patterns in reviewer request distribution.
+        
+        This method identifies concentration patterns, diversity metrics, and
+        potential bottlenecks in reviewer assignments.
+        
+        Args:
+            reviewer_data: Aggregated reviewer request data
+            
+        Returns:
+            Dictionary containing distribution analysis:
+            {
+                'concentration_ratio': float,     # % of requests handled by top 20% reviewers
+                'gini_coefficient': float,        # Inequality measure (0=equal, 1=max inequality)
+                'top_reviewers': List[Dict],      # Top 10 most requested reviewers
+                'underutilized_reviewers': List[Dict],  # Reviewers with very low request counts
+                'reviewer_diversity_score': float     # Measure of request distribution evenness
+            }
+        """
+        ranked, request_counts = self._rank_reviewers(reviewer_data)
+        return self._distribution_from_ranked(ranked, request_counts)
+    
+    def _rank_reviewers(self, reviewer_data: Dict[str, Dict[str, Any]]) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[int]]:
+        """
+        Rank reviewers by request count so the analysis steps can share one sort.
+        
+        Every entry produced by aggregate_reviewer_requests() carries 'total_requests',
+        so it is read directly here and by the helpers that consume the ranking.
+        
+        Args:
+            reviewer_data: Aggregated reviewer request data
+            
+        Returns:
+            Tuple of (reviewer items sorted by total_requests descending,
+            matching list of request counts in the same order)
+        """
+        ranked = sorted(
+            reviewer_data.items(),
+            key=lambda item: item[1]['total_requests'],
+            reverse=True
+        )
+        request_counts = [data['total_requests'] for _, data in ranked]
+        return ranked, request_counts
+    
+    def _overload_from_ranked(self, ranked: List[Tuple[str, Dict[str, Any]]], request_counts: List[int],
+                              threshold: Optional[int] = None) -> Dict[str, List[str]]:
+        """Categorize ranked reviewers by overload status (see detect_reviewer_overload)."""
+        if not ranked:
             return {'OVERLOADED': [], 'HIGH': [], 'NORMAL': []}
         
         threshold = threshold or self.default_threshold
@@ -192,22 +339,18 @@ class ReviewerWorkloadAnalyzer:
             'NORMAL': []
         }
         
-        for login, data in reviewer_data.items():
-            request_count = data.get('total_requests', 0)
+        # Partitioning the ranked list keeps every category sorted without a per-category sort
+        for index, request_count in enumerate(request_counts):
+            login = ranked[index][0]
             
             if request_count >= threshold:
                 categorized['OVERLOADED'].append(login)
             elif request_count >= high_threshold:
                 categorized['HIGH'].append(login)
             else:
-                categorized['NORMAL'].append(login)
-        
-        # Sort each category by total_requests descending
-        for category in categorized:
-            categorized[category].sort(
-                key=lambda login: reviewer_data.get(login, {}).get('total_requests', 0),
-                reverse=True
-            )
+                # Everything after this point is below the high threshold too
+                categorized['NORMAL'] = [login for login, _ in ranked[index:]]
+                break
         
         self.logger.info(
             f"Overload detection (threshold={threshold}): "
@@ -218,29 +361,9 @@ class ReviewerWorkloadAnalyzer:
         
         return categorized
     
-    def calculate_reviewer_statistics(self, reviewer_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Calculate statistical metrics for reviewer request distribution.
-        
-        Args:
-            reviewer_data: Aggregated reviewer request data
-            
-        Returns:
-            Dictionary containing statistical metrics:
-            {
-                'total_reviewers': int,
-                'total_requests': int,
-                'mean_requests': float,
-                'median_requests': float,
-                'std_dev_requests': float,
-                'min_requests': int,
-                'max_requests': int,
-                'percentile_75': float,
-                'percentile_90': float,
-                'percentile_95': float
-            }
-        """
-        if not reviewer_data:
+    def _statistics_from_counts(self, request_counts: List[int]) -> Dict[str, Any]:
+        """Calculate statistical metrics from ranked request counts (see calculate_reviewer_statistics)."""
+        if not request_counts:
             return {
                 'total_reviewers': 0,
                 'total_requests': 0,
@@ -254,16 +377,15 @@ class ReviewerWorkloadAnalyzer:
                 'percentile_95': 0.0
             }
         
-        request_counts = [data.get('total_requests', 0) for data in reviewer_data.values()]
         total_requests = sum(request_counts)
         
         stats = {
-            'total_reviewers': len(reviewer_data),
+            'total_reviewers': len(request_counts),
             'total_requests': total_requests,
-            'mean_requests': statistics.mean(request_counts),
+            'mean_requests': total_requests / len(request_counts),
             'median_requests': statistics.median(request_counts),
-            'min_requests': min(request_counts),
-            'max_requests': max(request_counts),
+            'min_requests': request_counts[-1],
+            'max_requests': request_counts[0],
         }
         
         # Calculate standard deviation (handle single data point case)
@@ -273,39 +395,17 @@ class ReviewerWorkloadAnalyzer:
             stats['std_dev_requests'] = 0.0
         
         # Calculate percentiles
-        if request_counts:
-            stats['percentile_75'] = self._calculate_percentile(request_counts, 75)
-            stats['percentile_90'] = self._calculate_percentile(request_counts, 90)
-            stats['percentile_95'] = self._calculate_percentile(request_counts, 95)
-        else:
-            stats['percentile_75'] = 0.0
-            stats['percentile_90'] = 0.0
-            stats['percentile_95'] = 0.0
+        stats['percentile_75'] = self._calculate_percentile(request_counts, 75)
+        stats['percentile_90'] = self._calculate_percentile(request_counts, 90)
+        stats['percentile_95'] = self._calculate_percentile(request_counts, 95)
         
         self.logger.debug(f"Calculated reviewer statistics: {stats}")
         return stats
     
-    def analyze_reviewer_distribution(self, reviewer_data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-        """
-        Analyze patterns in reviewer request distribution.
-        
-        This method identifies concentration patterns, diversity metrics, and
-        potential bottlenecks in reviewer assignments.
-        
-        Args:
-            reviewer_data: Aggregated reviewer request data
-            
-        Returns:
-            Dictionary containing distribution analysis:
-            {
-                'concentration_ratio': float,     # % of requests handled by top 20% reviewers
-                'gini_coefficient': float,        # Inequality measure (0=equal, 1=max inequality)
-                'top_reviewers': List[Dict],      # Top 10 most requested reviewers
-                'underutilized_reviewers': List[Dict],  # Reviewers with very low request counts
-                'reviewer_diversity_score': float     # Measure of request distribution evenness
-            }
-        """
-        if not reviewer_data:
+    def _distribution_from_ranked(self, ranked: List[Tuple[str, Dict[str, Any]]],
+                                  request_counts: List[int]) -> Dict[str, Any]:
+        """Analyze request distribution across ranked reviewers (see analyze_reviewer_distribution)."""
+        if not ranked:
             return {
                 'concentration_ratio': 0.0,
                 'gini_coefficient': 0.0,
@@ -314,47 +414,44 @@ class ReviewerWorkloadAnalyzer:
                 'reviewer_diversity_score': 0.0
             }
         
-        # Sort reviewers by request count (descending)
-        sorted_reviewers = sorted(
-            reviewer_data.items(),
-            key=lambda x: x[1].get('total_requests', 0),
-            reverse=True
-        )
-        
-        request_counts = [data[1].get('total_requests', 0) for data in sorted_reviewers]
         total_requests = sum(request_counts)
         
         # Calculate concentration ratio (requests handled by top 20% of reviewers)
-        top_20_percent_count = max(1, len(sorted_reviewers) // 5)
+        top_20_percent_count = max(1, len(ranked) // 5)
         top_20_percent_requests = sum(request_counts[:top_20_percent_count])
         concentration_ratio = top_20_percent_requests / total_requests if total_requests > 0 else 0.0
         
         # Calculate Gini coefficient for inequality measurement
-        gini_coefficient = self._calculate_gini_coefficient(request_counts)
+        gini_coefficient = self._calculate_gini_coefficient(request_counts, presorted_desc=True)
         
         # Identify top reviewers (top 10)
+        percent_per_request = 100.0 / total_requests if total_requests > 0 else 0.0
         top_reviewers = []
-        for i, (login, data) in enumerate(sorted_reviewers[:10]):
-            percentage = (data.get('total_requests', 0) / total_requests * 100) if total_requests > 0 else 0.0
+        for (login, data), request_count in zip(ranked[:10], request_counts):
             top_reviewers.append({
                 'login': login,
                 'name': data.get('name', login),
-                'total_requests': data.get('total_requests', 0),
-                'percentage_of_total': round(percentage, 2)
+                'total_requests': request_count,
+                'percentage_of_total': round(request_count * percent_per_request, 2)
             })
         
         # Identify underutilized reviewers (bottom 25% or those with <= 2 requests)
-        avg_requests = total_requests / len(reviewer_data) if reviewer_data else 0
+        avg_requests = total_requests / len(ranked)
         underutilized_threshold = max(2, avg_requests * 0.25)
         
-        underutilized_reviewers = []
-        for login, data in sorted_reviewers:
-            if data.get('total_requests', 0) <= underutilized_threshold:
-                underutilized_reviewers.append({
-                    'login': login,
-                    'name': data.get('name', login),
-                    'total_requests': data.get('total_requests', 0)
-                })
+        # Counts are ranked descending, so underutilized reviewers form the tail of the ranking
+        tail_start = len(request_counts)
+        while tail_start > 0 and request_counts[tail_start - 1] <= underutilized_threshold:
+            tail_start -= 1
+        
+        underutilized_reviewers = [
+            {
+                'login': login,
+                'name': data.get('name', login),
+                'total_requests': request_count
+            }
+            for (login, data), request_count in zip(ranked[tail_start:], request_counts[tail_start:])
+        ]
         
         # Calculate diversity score (1 / Gini coefficient, capped at 1.0)
         reviewer_diversity_score = min(1.0, (1.0 - gini_coefficient)) if gini_coefficient < 1.0 else 0.0
@@ -402,17 +499,22 @@ class ReviewerWorkloadAnalyzer:
             
             return float(sorted_data[lower_idx] * (1 - weight) + sorted_data[upper_idx] * weight)
     
-    def _calculate_gini_coefficient(self, values: List[float]) -> float:
+    def _calculate_gini_coefficient(self, values: List[float], presorted_desc: bool = False) -> float:
         """
         Calculate the Gini coefficient for measuring inequality.
         
+        Args:
+            values: Values to measure
+            presorted_desc: True if values are already sorted in descending order,
+                            in which case they are reversed instead of re-sorted
+        
         Returns value between 0 (perfect equality) and 1 (maximum inequality).
         """
         if not values or len(values) == 1:
             return 0.0
         
         # Sort values in ascending order
-        sorted_values = sorted(values)
+        sorted_values = values[::-1] if presorted_desc else sorted(values)
         n = len(sorted_values)
         
         # Calculate Gini coefficient using the formula:
@@ -459,14 +561,17 @@ class ReviewerWorkloadAnalyzer:
         # Aggregate reviewer request data
         reviewer_data = self.aggregate_reviewer_requests(prs, include_teams, org_name)
         
+        # Rank reviewers once and share the ranking across the analysis steps
+        ranked, request_counts = self._rank_reviewers(reviewer_data)
+        
         # Calculate statistics
-        statistics_data = self.calculate_reviewer_statistics(reviewer_data)
+        statistics_data = self._statistics_from_counts(request_counts)
         
         # Detect overload
-        overload_data = self.detect_reviewer_overload(reviewer_data, threshold)
+        overload_data = self._overload_from_ranked(ranked, request_counts, threshold)
         
         # Analyze distribution
-        distribution_data = self.analyze_reviewer_distribution(reviewer_data)
+        distribution_data = self._distribution_from_ranked(ranked, request_counts)
         
         # Generate metadata
         metadata = {
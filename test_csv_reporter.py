@@ -5,27 +5,25 @@ This module contains comprehensive tests for the CSVReporter class,
 including CSV generation, formatting, and error handling scenarios.
 """
 
+import io
 import pytest
-import tempfile
 import csv
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 
-from csv_reporter import CSVReporter, CSVReportError
+from csv_reporter import CSVReporter, CSVReportError, CSV_HEADERS, REVIEWER_CSV_HEADERS
 from datetime import datetime
 
 
 class TestCSVReporter:
     """Test cases for CSVReporter class initialization."""
     
-    def test_init_with_valid_path(self):
+    def test_init_with_valid_path(self, output_path):
         """Test CSVReporter initialization with valid output path."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test.csv"
-            reporter = CSVReporter(str(output_path))
-            
-            assert reporter.output_path == output_path
-            assert reporter.logger is not None
+        reporter = CSVReporter(str(output_path))
+        
+        assert reporter.output_path == output_path
+        assert reporter.logger is not None
     
     def test_init_with_empty_path(self):
         """Test CSVReporter initialization with empty output path raises error."""
@@ -37,31 +35,31 @@ class TestCSVReporter:
         with pytest.raises(CSVReportError, match="Output path is required"):
             CSVReporter(None)
     
-    def test_init_creates_directory(self):
+    def test_init_creates_directory(self, tmp_path):
         """Test CSVReporter initialization creates output directory if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            nested_path = Path(tmpdir) / "nested" / "dir" / "test.csv"
-            reporter = CSVReporter(str(nested_path))
-            
-            # Directory should be created
-            assert nested_path.parent.exists()
-            assert reporter.output_path == nested_path
+        nested_path = tmp_path / "nested" / "dir" / "test.csv"
+        reporter = CSVReporter(str(nested_path))
+        
+        # Directory should be created
+        assert nested_path.parent.exists()
+        assert reporter.output_path == nested_path
+    
+    def test_init_with_stream(self):
+        """Test CSVReporter writes into a caller-supplied stream and leaves it open."""
+        buf = io.StringIO()
+        reporter = CSVReporter(buf)
+        
+        reporter.generate_report({'pr_details': [{'pr_number': 1}]})
+        
+        assert not buf.closed
+        assert 'pr_number' in buf.getvalue()
+        assert buf.getvalue().endswith('\r\n')  # same CRLF line endings as the tracking CSVs
+        assert reporter.get_output_path() == '<stream>'
 
 
 class TestCSVGeneration:
     """Test cases for CSV file generation with all three metrics."""
     
-    def setup_method(self):
-        """Set up test reporter for each test method."""
-        self.tmpdir = tempfile.mkdtemp()
-        self.output_path = Path(self.tmpdir) / "test.csv"
-        self.reporter = CSVReporter(str(self.output_path))
-    
-    def teardown_method(self):
-        """Clean up after each test method."""
-        import shutil
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-    
     def test_csv_generation_with_complete_data(self):
         """Test CSV generation with complete PR data including all three timing metrics."""
         analysis_results = {
@@ -107,41 +105,37 @@ class TestCSVGeneration:
             ]
         }
         
-        result_path = self.reporter.generate_report(analysis_results)
-        
-        # Verify file was created
-        assert Path(result_path).exists()
-        assert result_path == str(self.output_path)
-        
-        # Verify CSV content
-        with open(result_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            # Check summary comments
-            assert '# Total PRs Analyzed: 2' in content
-            assert '# Average Time to First Review: 4.5 hours' in content
-            assert '# Average Time to Merge: 24.0 hours' in content
-            assert '# Average Commit Lead Time: 48.0 hours' in content
-            
-            # Check data presence
-            assert '123' in content
-            assert 'Fix critical bug' in content
-            assert '4.00' in content  # time_to_first_review_hours
-            assert '24.00' in content  # time_to_merge_hours
-            assert '48.00' in content  # commit_lead_time_hours
+        buf = io.StringIO()
+        CSVReporter(buf).generate_report(analysis_results)
+        
+        # Verify CSV content; only the generation timestamp varies between runs
+        lines = buf.getvalue().splitlines()
+        
+        assert lines[0].startswith('# GitHub PR Lifecycle Analysis Report - Generated ')
+        assert lines[1:] == [
+            '# Total PRs Analyzed: 2',
+            '# Merged PRs: 1',
+            '# Reviewed PRs: 2',
+            '# Average Time to First Review: 4.5 hours',
+            '# Average Time to Merge: 24.0 hours',
+            '# Average Commit Lead Time: 48.0 hours',
+            '',
+            ','.join(CSV_HEADERS),
+            '123,Fix critical bug,closed,2024-12-01 10:00:00 UTC,2024-12-02 10:00:00 UTC,,,,4.00,24.00,48.00,True,2,3,5,True',
+            '124,Add new feature,open,2024-12-03 15:30:00 UTC,,,,,5.00,,,True,1,0,3,False'
+        ]
     
-    def test_csv_generation_empty_details(self):
+    def test_csv_generation_empty_details(self, reporter, output_path):
         """Test CSV generation with empty PR details."""
         analysis_results = {
             'summary': {'total_prs_analyzed': 0},
             'pr_details': []
         }
         
-        result_path = self.reporter.generate_report(analysis_results)
-        
-        # File should be created with headers only
-        assert Path(result_path).exists()
+        result_path = reporter.generate_report(analysis_results)
+        assert result_path == str(output_path)
         
+        # File should be created with headers only; open() fails if it is missing
         with open(result_path, 'r', encoding='utf-8') as f:
             reader = csv.reader(f)
             rows = list(reader)
@@ -158,36 +152,42 @@ class TestCSVGeneration:
             
             assert header_found, "Headers not found in CSV"
     
-    def test_csv_generation_missing_analysis_results(self):
+    @pytest.mark.parametrize("title", [
+        'Plain title',
+        'Title, with comma',
+        'Title with "quotes"',
+    ])
+    def test_data_rows_match_csv_writer(self, title):
+        """Test data rows are byte-identical to csv.writer output whether or not quoting is needed."""
+        rows = [['1', title, 'open'], ['2', 'Other', '']]
+        
+        expected = io.StringIO()
+        csv.writer(expected).writerows(rows)
+        
+        buf = io.StringIO()
+        CSVReporter(buf)._write_data_rows(buf, csv.writer(buf), rows)
+        
+        assert buf.getvalue() == expected.getvalue()
+    
+    def test_csv_generation_missing_analysis_results(self, reporter):
         """Test CSV generation with missing analysis results raises error."""
         with pytest.raises(CSVReportError, match="Analysis results are required"):
-            self.reporter.generate_report(None)
+            reporter.generate_report(None)
     
-    def test_csv_generation_missing_pr_details(self):
+    def test_csv_generation_missing_pr_details(self, reporter):
         """Test CSV generation with missing pr_details key raises error."""
         analysis_results = {'summary': {'total': 0}}
         
         with pytest.raises(CSVReportError, match="Analysis results must contain 'pr_details'"):
-            self.reporter.generate_report(analysis_results)
+            reporter.generate_report(analysis_results)
 
 
 class TestCSVHeaders:
     """Test cases for CSV column validation including all three metric columns."""
     
-    def setup_method(self):
-        """Set up test reporter for each test method."""
-        self.tmpdir = tempfile.mkdtemp()
-        self.output_path = Path(self.tmpdir) / "test.csv"
-        self.reporter = CSVReporter(str(self.output_path))
-    
-    def teardown_method(self):
-        """Clean up after each test method."""
-        import shutil
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-    
-    def test_csv_headers_include_all_metrics(self):
+    def test_csv_headers_include_all_metrics(self, reporter):
         """Test CSV headers include all three timing metric columns."""
-        headers = self.reporter._format_csv_headers()
+        headers = reporter._format_csv_headers()
         
         # Verify all expected headers are present
         expected_headers = [
@@ -210,6 +210,7 @@ class TestCSVHeaders:
         ]
         
         assert headers == expected_headers
+        assert headers == list(CSV_HEADERS)
     
     def test_csv_headers_in_generated_file(self):
         """Test CSV headers appear correctly in generated file."""
@@ -226,40 +227,37 @@ class TestCSVHeaders:
             ]
         }
         
-        self.reporter.generate_report(analysis_results)
+        buf = io.StringIO()
+        CSVReporter(buf).generate_report(analysis_results)
         
         # Read and verify headers
-        with open(self.output_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            
-            # Skip comment lines
-            for row in reader:
-                if row and not row[0].startswith('#'):
-                    # This should be the header row
-                    assert 'time_to_first_review_hours' in row
-                    assert 'time_to_merge_hours' in row
-                    assert 'commit_lead_time_hours' in row
-                    break
+        reader = csv.reader(io.StringIO(buf.getvalue()))
+        
+        # Skip comment lines
+        for row in reader:
+            if row and not row[0].startswith('#'):
+                # This should be the header row
+                assert 'time_to_first_review_hours' in row
+                assert 'time_to_merge_hours' in row
+                assert 'commit_lead_time_hours' in row
+                break
 
-    def test_csv_headers_include_new_fields(self):
+    def test_csv_headers_include_new_fields(self, reporter):
         """Test CSV headers include new repository name and PR creator GitHub ID fields."""
-        headers = self.reporter._format_csv_headers()
+        headers = reporter._format_csv_headers()
         
         # Verify new fields are present in correct positions
         assert 'repository_name' in headers
         assert 'pr_creator_github_id' in headers
         
         # Verify they appear after merged_at but before timing metrics
-        repo_index = headers.index('repository_name')
-        creator_index = headers.index('pr_creator_github_id')
-        merged_at_index = headers.index('merged_at')
-        review_time_index = headers.index('time_to_first_review_hours')
-        
-        assert repo_index == merged_at_index + 1
-        assert creator_index == merged_at_index + 2
-        assert review_time_index > creator_index
+        pos = {header: i for i, header in enumerate(headers)}
+        
+        assert pos['repository_name'] == pos['merged_at'] + 1
+        assert pos['pr_creator_github_id'] == pos['merged_at'] + 2
+        assert pos['time_to_first_review_hours'] > pos['pr_creator_github_id']
 
-    def test_csv_data_formatting_with_new_fields(self):
+    def test_csv_data_formatting_with_new_fields(self, reporter):
         """Test CSV data formatting includes new repository and creator fields."""
         pr_details = [
             {
@@ -282,7 +280,7 @@ class TestCSVHeaders:
             }
         ]
         
-        rows = self.reporter._format_csv_rows(pr_details)
+        rows = reporter._format_csv_rows(pr_details)
         
         assert len(rows) == 1
         row = rows[0]
@@ -290,7 +288,7 @@ class TestCSVHeaders:
         assert row[6] == '12345'  # pr_creator_github_id position
         assert row[7] == 'testuser'  # pr_creator_username position
 
-    def test_csv_validation_requires_new_fields(self):
+    def test_csv_validation_requires_new_fields(self, reporter):
         """Test CSV validation requires repository name and creator GitHub ID fields."""
         # Missing repository_name should raise error
         analysis_results_missing_repo = {
@@ -304,7 +302,7 @@ class TestCSVHeaders:
         }
         
         with pytest.raises(CSVReportError, match="missing required field: repository_name"):
-            self.reporter.validate_analysis_results(analysis_results_missing_repo)
+            reporter.validate_analysis_results(analysis_results_missing_repo)
         
         # Missing pr_creator_github_id should raise error
         analysis_results_missing_creator = {
@@ -318,7 +316,7 @@ class TestCSVHeaders:
         }
         
         with pytest.raises(CSVReportError, match="missing required field: pr_creator_github_id"):
-            self.reporter.validate_analysis_results(analysis_results_missing_creator)
+            reporter.validate_analysis_results(analysis_results_missing_creator)
         
         # Valid data with new fields should pass
         analysis_results_valid = {
@@ -332,7 +330,7 @@ class TestCSVHeaders:
             ]
         }
         
-        assert self.reporter.validate_analysis_results(analysis_results_valid) == True
+        assert reporter.validate_analysis_results(analysis_results_valid) == True
 
     def test_csv_generation_with_repository_context(self):
         """Test complete CSV generation with repository context in summary."""
@@ -381,40 +379,26 @@ class TestCSVHeaders:
             ]
         }
         
-        output_file = self.reporter.generate_report(analysis_results)
-        
-        # Verify file was generated
-        assert Path(output_file).exists()
+        buf = io.StringIO()
+        CSVReporter(buf).generate_report(analysis_results)
         
         # Read and verify content
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            # Verify repository context in summary
-            assert '# Repository: microsoft/vscode' in content
-            assert '# Total PRs Analyzed: 2' in content
-            
-            # Verify new fields in data
-            assert 'microsoft/vscode' in content
-            assert '98765' in content
-            assert '54321' in content
+        content = buf.getvalue()
+        
+        # Verify repository context in summary
+        assert '# Repository: microsoft/vscode' in content
+        assert '# Total PRs Analyzed: 2' in content
+        
+        # Verify new fields in data
+        assert 'microsoft/vscode' in content
+        assert '98765' in content
+        assert '54321' in content
 
 
 class TestCSVDataFormatting:
     """Test cases for data transformation and formatting with all three metrics."""
     
-    def setup_method(self):
-        """Set up test reporter for each test method."""
-        self.tmpdir = tempfile.mkdtemp()
-        self.output_path = Path(self.tmpdir) / "test.csv"
-        self.reporter = CSVReporter(str(self.output_path))
-    
-    def teardown_method(self):
-        """Clean up after each test method."""
-        import shutil
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-    
-    def test_csv_data_formatting_with_all_metrics(self):
+    def test_csv_data_formatting_with_all_metrics(self, reporter):
         """Test CSV data formatting includes all three timing metrics."""
         pr_details = [
             {
@@ -437,7 +421,7 @@ class TestCSVDataFormatting:
             }
         ]
         
-        rows = self.reporter._format_csv_rows(pr_details)
+        rows = reporter._format_csv_rows(pr_details)
         
         assert len(rows) == 1
         row = rows[0]
@@ -453,7 +437,7 @@ class TestCSVDataFormatting:
         assert row[10] == '72.25'  # commit_lead_time_hours
         assert row[15] == 'True'  # is_merged
     
-    def test_csv_data_formatting_with_null_metrics(self):
+    def test_csv_data_formatting_with_null_metrics(self, reporter):
         """Test CSV data formatting handles None values for metrics."""
         pr_details = [
             {
@@ -476,7 +460,7 @@ class TestCSVDataFormatting:
             }
         ]
         
-        rows = self.reporter._format_csv_rows(pr_details)
+        rows = reporter._format_csv_rows(pr_details)
         
         assert len(rows) == 1
         row = rows[0]
@@ -490,61 +474,61 @@ class TestCSVDataFormatting:
         assert row[5] == 'test/repo'  # repository_name
         assert row[6] == '67890'  # pr_creator_github_id
     
-    def test_text_sanitization(self):
+    def test_csv_data_formatting_with_partial_record(self, reporter):
+        """Test CSV data formatting falls back to defaults for missing keys."""
+        rows = reporter._format_csv_rows([{'pr_number': 7, 'title': 'Partial'}])
+        
+        assert rows == [['7', 'Partial', '', '', '', '', '', '', '', '', '',
+                         'False', '0', '0', '0', 'False']]
+    
+    def test_text_sanitization(self, reporter):
         """Test text sanitization for CSV safety."""
         # Test newlines and tabs
-        assert self.reporter._sanitize_text("Line 1\nLine 2\tTabbed") == "Line 1 Line 2 Tabbed"
+        assert reporter._sanitize_text("Line 1\nLine 2\tTabbed") == "Line 1 Line 2 Tabbed"
         
         # Test excessive whitespace
-        assert self.reporter._sanitize_text("  Too   many   spaces  ") == "Too many spaces"
+        assert reporter._sanitize_text("  Too   many   spaces  ") == "Too many spaces"
         
         # Test long text truncation
         long_text = "A" * 250
-        result = self.reporter._sanitize_text(long_text)
+        result = reporter._sanitize_text(long_text)
         assert len(result) == 200
         assert result.endswith("...")
     
-    def test_datetime_formatting(self):
+    def test_datetime_formatting(self, reporter):
         """Test datetime formatting for consistent CSV output."""
         # Test ISO format with Z
-        result = self.reporter._format_datetime("2024-12-01T10:30:45Z")
+        result = reporter._format_datetime("2024-12-01T10:30:45Z")
         assert result == "2024-12-01 10:30:45 UTC"
         
         # Test ISO format with timezone
-        result = self.reporter._format_datetime("2024-12-01T10:30:45+00:00")
+        result = reporter._format_datetime("2024-12-01T10:30:45+00:00")
         assert result == "2024-12-01 10:30:45 UTC"
         
         # Test None value
-        assert self.reporter._format_datetime(None) == ""
+        assert reporter._format_datetime(None) == ""
         
         # Test empty string
-        assert self.reporter._format_datetime("") == ""
+        assert reporter._format_datetime("") == ""
+        
+        # Unparseable values are passed through unchanged (including on a cache hit)
+        assert reporter._format_datetime("not a date") == "not a date"
+        assert reporter._format_datetime("not a date") == "not a date"
     
-    def test_number_formatting(self):
+    def test_number_formatting(self, reporter):
         """Test numeric value formatting for CSV."""
         # Test float formatting
-        assert self.reporter._format_number(12.345) == "12.35"
-        assert self.reporter._format_number(0.0) == "0.00"
-        assert self.reporter._format_number(100) == "100.00"
+        assert reporter._format_number(12.345) == "12.35"
+        assert reporter._format_number(0.0) == "0.00"
+        assert reporter._format_number(100) == "100.00"
         
         # Test None value
-        assert self.reporter._format_number(None) == ""
+        assert reporter._format_number(None) == ""
 
 
 class TestCSVValidation:
     """Test cases for analysis results validation."""
     
-    def setup_method(self):
-        """Set up test reporter for each test method."""
-        self.tmpdir = tempfile.mkdtemp()
-        self.output_path = Path(self.tmpdir) / "test.csv"
-        self.reporter = CSVReporter(str(self.output_path))
-    
-    def teardown_method(self):
-        """Clean up after each test method."""
-        import shutil
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-    
     def test_validate_valid_analysis_results(self):
         """Test validation of valid analysis results."""
         valid_results = {
@@ -560,87 +544,44 @@ class TestCSVValidation:
             ]
         }
         
-        assert self.reporter.validate_analysis_results(valid_results) is True
-    
-    def test_validate_non_dict_results(self):
-        """Test validation fails for non-dictionary results."""
-        with pytest.raises(CSVReportError, match="Analysis results must be a dictionary"):
-            self.reporter.validate_analysis_results("not a dict")
-    
-    def test_validate_missing_pr_details(self):
-        """Test validation fails for missing pr_details."""
-        invalid_results = {'summary': {'total': 0}}
-        
-        with pytest.raises(CSVReportError, match="Analysis results must contain 'pr_details' key"):
-            self.reporter.validate_analysis_results(invalid_results)
-    
-    def test_validate_non_list_pr_details(self):
-        """Test validation fails for non-list pr_details."""
-        invalid_results = {'pr_details': 'not a list'}
-        
-        with pytest.raises(CSVReportError, match="'pr_details' must be a list"):
-            self.reporter.validate_analysis_results(invalid_results)
-    
-    def test_validate_invalid_pr_detail_structure(self):
-        """Test validation fails for invalid PR detail structure."""
-        invalid_results = {
-            'pr_details': [
-                'not a dict'
-            ]
-        }
-        
-        with pytest.raises(CSVReportError, match="PR detail at index 0 must be a dictionary"):
-            self.reporter.validate_analysis_results(invalid_results)
-    
-    def test_validate_missing_required_fields(self):
-        """Test validation fails for missing required fields in PR details."""
-        invalid_results = {
-            'pr_details': [
-                {'title': 'Missing pr_number'}
-            ]
-        }
-        
-        with pytest.raises(CSVReportError, match="PR detail at index 0 missing required field: pr_number"):
-            self.reporter.validate_analysis_results(invalid_results)
+        assert CSVReporter.validate_analysis_results(valid_results) is True
+    
+    @pytest.mark.parametrize("invalid_results,match", [
+        ("not a dict", "Analysis results must be a dictionary"),
+        ({'summary': {'total': 0}}, "Analysis results must contain 'pr_details' key"),
+        ({'pr_details': 'not a list'}, "'pr_details' must be a list"),
+        ({'pr_details': ['not a dict']}, "PR detail at index 0 must be a dictionary"),
+        ({'pr_details': [{'title': 'Missing pr_number'}]},
+         "PR detail at index 0 missing required field: pr_number"),
+    ], ids=["non_dict_results", "missing_pr_details", "non_list_pr_details",
+            "invalid_pr_detail_structure", "missing_required_fields"])
+    def test_validation_errors(self, invalid_results, match):
+        """Test validation fails with a descriptive error for malformed results."""
+        with pytest.raises(CSVReportError, match=match):
+            CSVReporter.validate_analysis_results(invalid_results)
 
 
 class TestCSVReporterUtilities:
     """Test cases for utility methods."""
     
-    def setup_method(self):
-        """Set up test reporter for each test method."""
-        self.tmpdir = tempfile.mkdtemp()
-        self.output_path = Path(self.tmpdir) / "test.csv"
-        self.reporter = CSVReporter(str(self.output_path))
-    
-    def teardown_method(self):
-        """Clean up after each test method."""
-        import shutil
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-    
-    def test_get_output_path(self):
+    def test_get_output_path(self, reporter, output_path):
         """Test get_output_path returns correct path."""
-        assert self.reporter.get_output_path() == str(self.output_path)
+        assert reporter.get_output_path() == str(output_path)
 
 
 class TestErrorHandling:
     """Test cases for error handling scenarios."""
     
-    def test_csv_generation_with_file_write_error(self):
+    def test_csv_generation_with_file_write_error(self, reporter):
         """Test CSV generation handles file write errors gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a valid reporter first
-            output_path = Path(tmpdir) / "test.csv"
-            reporter = CSVReporter(str(output_path))
-            
-            analysis_results = {
-                'pr_details': [{'pr_number': 1}]
-            }
-            
-            # Mock the file open to raise an exception
-            with patch('builtins.open', side_effect=PermissionError("Access denied")):
-                with pytest.raises(CSVReportError, match="Failed to generate CSV report"):
-                    reporter.generate_report(analysis_results)
+        analysis_results = {
+            'pr_details': [{'pr_number': 1}]
+        }
+        
+        # Mock the file open to raise an exception
+        with patch('builtins.open', side_effect=PermissionError("Access denied")):
+            with pytest.raises(CSVReportError, match="Failed to generate CSV report"):
+                reporter.generate_report(analysis_results)
 
 
 # Test fixtures
@@ -691,118 +632,61 @@ def sample_analysis_results():
     }
 
 
+@pytest.fixture
+def output_path(tmp_path):
+    """Fixture providing a per-test CSV output path under pytest's tmp_path."""
+    return tmp_path / "test.csv"
+
+
+@pytest.fixture
+def reporter(output_path):
+    """Fixture providing a reporter writing to the per-test output path."""
+    return CSVReporter(str(output_path))
+
+
 class TestReviewerCSVGeneration:
     """Test reviewer workload analysis CSV generation functionality."""
     
-    def setup_method(self):
-        """Set up test fixtures for reviewer CSV tests."""
-        self.tmpdir = tempfile.mkdtemp()
-        self.output_file = Path(self.tmpdir) / "reviewer_test.csv"
-        
-        # Mock reviewer summary data
-        self.mock_reviewer_summary = {
-            'metadata': {
-                'analysis_date': '2024-12-15T12:00:00',
-                'total_prs_analyzed': 25,
-                'include_teams': True,
-                'overload_threshold': 15,
-                'org_name': 'testorg'
-            },
-            'reviewer_data': {
-                'alice': {
-                    'login': 'alice',
-                    'name': 'Alice Johnson',
-                    'total_requests': 20,
-                    'pr_numbers': [100, 101, 102, 103, 104],
-                    'request_sources': ['individual', 'individual', 'team:core', 'individual', 'team:backend'],
-                    'first_request_date': '2024-11-01T10:00:00Z',
-                    'last_request_date': '2024-12-10T15:30:00Z'
-                },
-                'bob': {
-                    'login': 'bob',
-                    'name': 'Bob Smith',
-                    'total_requests': 8,
-                    'pr_numbers': [105, 106, 107],
-                    'request_sources': ['individual', 'individual', 'individual'],
-                    'first_request_date': '2024-11-15T09:00:00Z',
-                    'last_request_date': '2024-12-05T14:00:00Z'
-                },
-                'team:frontend': {
-                    'login': 'team:frontend',
-                    'name': 'Team: Frontend',
-                    'total_requests': 12,
-                    'pr_numbers': [108, 109, 110, 111],
-                    'request_sources': ['team:frontend', 'team:frontend', 'team:frontend', 'team:frontend'],
-                    'first_request_date': '2024-11-20T11:00:00Z',
-                    'last_request_date': '2024-12-08T16:00:00Z'
-                }
-            },
-            'statistics': {
-                'total_reviewers': 3,
-                'total_requests': 40,
-                'mean_requests': 13.33,
-                'median_requests': 12,
-                'std_dev_requests': 6.02,
-                'min_requests': 8,
-                'max_requests': 20
-            },
-            'overload_analysis': {
-                'OVERLOADED': ['alice'],
-                'HIGH': ['team:frontend'],
-                'NORMAL': ['bob']
-            },
-            'distribution_analysis': {
-                'concentration_ratio': 0.5,
-                'gini_coefficient': 0.35,
-                'reviewer_diversity_score': 0.65,
-                'top_reviewers': [
-                    {'login': 'alice', 'name': 'Alice Johnson', 'total_requests': 20, 'percentage_of_total': 50.0}
-                ],
-                'underutilized_reviewers': []
-            }
-        }
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        import shutil
-        shutil.rmtree(self.tmpdir, ignore_errors=True)
-    
-    def test_generate_reviewer_report_success(self):
+    def test_generate_reviewer_report_success(self, reporter, reviewer_summary):
         """Test successful reviewer CSV report generation."""
-        reporter = CSVReporter(self.output_file)
+        output_path = reporter.generate_reviewer_report(reviewer_summary)
         
-        output_path = reporter.generate_reviewer_report(self.mock_reviewer_summary)
-        
-        assert output_path == str(self.output_file)
-        assert self.output_file.exists()
+        assert output_path == str(reporter.output_path)
         
         # Read and verify CSV content
-        with open(self.output_file, 'r', encoding='utf-8') as f:
+        with open(reporter.output_path, 'r', encoding='utf-8', newline='') as f:
             content = f.read()
         
-        # Check for header comments
-        assert "# GitHub PR Reviewer Workload Analysis Report" in content
-        assert "# Total PRs Analyzed: 25" in content
-        assert "# Overload Threshold: 15 requests" in content
-        assert "# Team Analysis Enabled: True" in content
-        assert "# Organization: testorg" in content
-        assert "# Total Reviewers: 3" in content
-        assert "# Total Review Requests: 40" in content
-        
-        # Check for CSV headers
-        assert "reviewer_login,reviewer_name,reviewer_type" in content
-        assert "total_requests,pr_numbers,request_sources" in content
-        assert "workload_status,workload_category" in content
-        
-        # Check for data rows
-        assert "alice,Alice Johnson,user,20" in content
-        assert "bob,Bob Smith,user,8" in content
-        assert "team:frontend,Team: Frontend,team,12" in content
-    
-    def test_reviewer_csv_headers(self):
+        # Every line ends in CRLF, matching the tracking CSVs
+        assert content.count('\r\n') == content.count('\n')
+        
+        expected_fragments = (
+            # Header comments
+            "# GitHub PR Reviewer Workload Analysis Report",
+            "# Total PRs Analyzed: 25",
+            "# Overload Threshold: 15 requests",
+            "# Team Analysis Enabled: True",
+            "# Organization: testorg",
+            "# Total Reviewers: 3",
+            "# Total Review Requests: 40",
+            # CSV headers
+            "reviewer_login,reviewer_name,reviewer_type",
+            "total_requests,pr_numbers,request_sources",
+            "workload_status,workload_category",
+            # Data rows
+            "alice,Alice Johnson,user,20",
+            "bob,Bob Smith,user,8",
+            "team:frontend,Team: Frontend,team,12",
+            # Per-source request counts
+            "individual (3), team:core (1), team:backend (1)",
+            "team:frontend (4)",
+        )
+        
+        missing = [fragment for fragment in expected_fragments if fragment not in content]
+        assert not missing, missing
+    
+    def test_reviewer_csv_headers(self, reporter):
         """Test reviewer CSV header structure."""
-        reporter = CSVReporter(self.output_file)
-        
         headers = reporter._format_reviewer_csv_headers()
         
         expected_headers = [
@@ -813,13 +697,12 @@ class TestReviewerCSVGeneration:
         ]
         
         assert headers == expected_headers
+        assert headers == list(REVIEWER_CSV_HEADERS)
     
-    def test_reviewer_csv_row_formatting(self):
+    def test_reviewer_csv_row_formatting(self, reporter, reviewer_summary):
         """Test reviewer CSV data row formatting."""
-        reporter = CSVReporter(self.output_file)
-        
-        overload_analysis = self.mock_reviewer_summary['overload_analysis']
-        reviewer_data = self.mock_reviewer_summary['reviewer_data']
+        overload_analysis = reviewer_summary['overload_analysis']
+        reviewer_data = reviewer_summary['reviewer_data']
         
         rows = reporter._format_reviewer_csv_rows(reviewer_data, overload_analysis)
         
@@ -841,31 +724,74 @@ class TestReviewerCSVGeneration:
         assert alice_row[10] == 'OVERLOADED'  # workload_status
         assert alice_row[11] == 'Overloaded'  # workload_category
     
-    def test_validate_reviewer_summary_success(self):
-        """Test successful reviewer summary validation."""
-        reporter = CSVReporter(self.output_file)
+    def test_reviewer_name_falls_back_to_login(self, reporter, reviewer_summary):
+        """Test reviewers without a display name are listed under their login."""
+        del reviewer_summary['reviewer_data']['bob']['name']
+        
+        rows = reporter._format_reviewer_csv_rows(reviewer_summary['reviewer_data'],
+                                                  reviewer_summary['overload_analysis'])
+        
+        bob_row = next(row for row in rows if row[0] == 'bob')
+        assert bob_row[1] == 'bob'
+    
+    def test_append_reviewer_tracking_rows_top_n(self, reporter, reviewer_summary, tmp_path):
+        """Test reviewer tracking rows keep the busiest reviewers in descending order."""
+        tracking_file = tmp_path / "reviewer_tracking.csv"
         
+        reporter.append_reviewer_tracking_rows(str(tracking_file), '2024-11', 'org/repo',
+                                               reviewer_summary, top_n=2)
+        
+        with open(tracking_file, 'r', encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        
+        assert rows == [
+            ['period', 'repository', 'reviewer', 'requests', 'workload_status', 'percentage_of_total'],
+            ['2024-11', 'org/repo', 'alice', '20', 'OVERLOADED', '50.00'],
+            ['2024-11', 'org/repo', 'team:frontend', '12', 'HIGH', '30.00']
+        ]
+        # Tracking files share the report dialect's CRLF line endings
+        raw = tracking_file.read_bytes()
+        assert raw.count(b'\r\n') == raw.count(b'\n') == 3
+    
+    def test_request_sources_formatting(self, reporter):
+        """Test request sources are rendered as per-source counts."""
+        # Aggregated mapping as produced by ReviewerWorkloadAnalyzer
+        assert reporter._format_request_sources({'individual': 3, 'team:core': 1}) == "individual (3), team:core (1)"
+        
+        # Legacy list of one source per request is counted
+        sources = ['individual', 'individual', 'team:core', 'individual', 'team:backend']
+        assert reporter._format_request_sources(sources) == "individual (3), team:core (1), team:backend (1)"
+        
+        # Missing sources
+        assert reporter._format_request_sources(None) == ""
+        assert reporter._format_request_sources({}) == ""
+    
+    def test_validate_reviewer_summary_success(self, reporter, reviewer_summary):
+        """Test successful reviewer summary validation."""
         # Should not raise any exception
-        result = reporter.validate_reviewer_summary(self.mock_reviewer_summary)
+        result = reporter.validate_reviewer_summary(reviewer_summary)
         assert result is True
     
-    def test_validate_reviewer_summary_invalid_structure(self):
+    def test_validate_reviewer_summary_invalid_structure(self, reporter):
         """Test reviewer summary validation with invalid structures."""
-        reporter = CSVReporter(self.output_file)
-        
         # Invalid: not a dictionary
         with pytest.raises(CSVReportError, match="must be a dictionary"):
             reporter.validate_reviewer_summary("invalid")
         
-        # Invalid: missing required keys
+        # Invalid: missing required keys (all reported, in declaration order)
         invalid_summary = {'reviewer_data': {}}
-        with pytest.raises(CSVReportError, match="must contain 'metadata' key"):
+        with pytest.raises(CSVReportError, match="must contain 'metadata' key") as excinfo:
+            reporter.validate_reviewer_summary(invalid_summary)
+        assert "also missing: 'statistics', 'overload_analysis'" in str(excinfo.value)
+        
+        # Invalid: reviewer entry missing a required field
+        invalid_summary = {'reviewer_data': {'bob': {'login': 'bob', 'pr_numbers': []}},
+                           'metadata': {}, 'statistics': {}, 'overload_analysis': {}}
+        with pytest.raises(CSVReportError, match="Reviewer data for 'bob' missing required field: total_requests"):
             reporter.validate_reviewer_summary(invalid_summary)
     
-    def test_generate_reviewer_report_empty_data(self):
+    def test_generate_reviewer_report_empty_data(self, reporter):
         """Test reviewer report generation with empty data."""
-        reporter = CSVReporter(self.output_file)
-        
         empty_summary = {
             'reviewer_data': {},
             'metadata': {},
@@ -876,11 +802,10 @@ class TestReviewerCSVGeneration:
         
         output_path = reporter.generate_reviewer_report(empty_summary)
         
-        assert output_path == str(self.output_file)
-        assert self.output_file.exists()
+        assert output_path == str(reporter.output_path)
         
         # Read and verify content
-        with open(self.output_file, 'r', encoding='utf-8') as f:
+        with open(reporter.output_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
         # Should have headers but no data rows
@@ -5,11 +5,16 @@ This module contains comprehensive tests for the GitHubClient class,
 including authentication, error handling, and rate limiting scenarios.
 """
 
-import os
+import logging
+import re
+import threading
+from collections import OrderedDict
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 import requests
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+from dateutil.relativedelta import relativedelta
 
 from github_client import (
     GitHubClient,
@@ -19,6 +24,69 @@ from github_client import (
     setup_logging
 )
 
+# Every test runs with requests.Session.get replaced, so nothing reaches the network
+pytestmark = pytest.mark.usefixtures('mock_get')
+
+
+def make_response(status, json_data=None, headers=None, text="", content=None):
+    """
+    Build a fake requests.Response for the Session.get mock.
+    
+    Only the attributes GitHubClient reads are present, so a typo in a test
+    or in the client raises AttributeError instead of returning a Mock.
+    """
+    return SimpleNamespace(
+        status_code=status,
+        headers={} if headers is None else headers,
+        json=lambda: json_data,
+        text=text,
+        content=content
+    )
+
+
+def paged(pages):
+    """Build a (url, params) stub that serves pages by the 'page' query parameter."""
+    def fetch(url, params=None):
+        page = params.get('page', 1) if params else 1
+        if page <= len(pages):
+            return pages[page - 1]
+        return []
+    return fetch
+
+
+# One shared instance; mock raises it as-is on every call
+_CONN_ERR = requests.ConnectionError("Connection failed")
+
+_RETRIES_EXHAUSTED = re.compile(r"GitHub API request to .* failed after .* attempts")
+
+_FIXED_NOW = datetime(2024, 12, 20, 15, 30, 45, 123456)
+_DEC_20 = datetime(2024, 12, 20, 10, 0, 0)
+_NOV_1 = datetime(2024, 11, 1)
+_NOV_15 = datetime(2024, 11, 15)
+_NOV_20 = datetime(2024, 11, 20)
+_ONE_MONTH = relativedelta(months=1)
+_THREE_MONTHS = relativedelta(months=3)
+
+
+# Rate limit headers; read-only because GitHubClient only ever reads response headers
+_FULL_RL_HEADERS = MappingProxyType({
+    'X-RateLimit-Remaining': '5000',
+    'X-RateLimit-Limit': '5000',
+    'X-RateLimit-Reset': '1640995200',
+    'X-RateLimit-Used': '0'
+})
+_DEPLETED_RL_HEADERS = MappingProxyType({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '1640995200'})
+_4999_OF_5000 = MappingProxyType({'X-RateLimit-Remaining': '4999', 'X-RateLimit-Limit': '5000'})
+
+# Repository payload; get_repository_info returns exactly these fields
+_REPO_INFO = {
+    'name': 'test-repo',
+    'full_name': 'testowner/test-repo',
+    'private': False,
+    'default_branch': 'main',
+    'created_at': '2023-01-01T00:00:00Z',
+    'updated_at': '2023-12-01T00:00:00Z'
+}
 
 class TestGitHubClient:
     """Test cases for GitHubClient class."""
@@ -35,353 +103,331 @@ class TestGitHubClient:
     
     def test_init_with_empty_token(self):
         """Test GitHubClient initialization with empty token raises error."""
-        with pytest.raises(GitHubAuthenticationError, match="GitHub token is required"):
+        with pytest.raises(GitHubAuthenticationError) as exc_info:
             GitHubClient("")
+        assert "GitHub token is required" in str(exc_info.value)
     
     def test_init_with_none_token(self):
         """Test GitHubClient initialization with None token raises error."""
-        with pytest.raises(GitHubAuthenticationError, match="GitHub token is required"):
+        with pytest.raises(GitHubAuthenticationError) as exc_info:
             GitHubClient(None)
+        assert "GitHub token is required" in str(exc_info.value)
 
 
 class TestTokenFromEnvironment:
     """Test cases for reading token from environment variables."""
     
-    @patch.dict(os.environ, {'GITHUB_TOKEN': 'env_token_456'})
-    def test_token_reading_from_env(self):
+    def test_token_reading_from_env(self, monkeypatch):
         """Test reading GitHub token from environment variable."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'env_token_456')
         token = GitHubClient.get_token_from_env()
         assert token == "env_token_456"
     
-    @patch.dict(os.environ, {}, clear=True)
-    def test_missing_environment_token(self):
+    def test_missing_environment_token(self, monkeypatch):
         """Test error when GITHUB_TOKEN environment variable is not set."""
-        with pytest.raises(GitHubAuthenticationError, match="GITHUB_TOKEN environment variable is not set"):
+        monkeypatch.delenv('GITHUB_TOKEN', raising=False)
+        with pytest.raises(GitHubAuthenticationError) as exc_info:
             GitHubClient.get_token_from_env()
+        assert "GITHUB_TOKEN environment variable is not set" in str(exc_info.value)
     
-    @patch.dict(os.environ, {'GITHUB_TOKEN': ''})
-    def test_empty_environment_token(self):
+    def test_empty_environment_token(self, monkeypatch):
         """Test error when GITHUB_TOKEN environment variable is empty."""
-        with pytest.raises(GitHubAuthenticationError, match="GITHUB_TOKEN environment variable is not set"):
+        monkeypatch.setenv('GITHUB_TOKEN', '')
+        with pytest.raises(GitHubAuthenticationError) as exc_info:
             GitHubClient.get_token_from_env()
+        assert "GITHUB_TOKEN environment variable is not set" in str(exc_info.value)
 
 
 class TestTokenValidation:
     """Test cases for token validation and API connectivity."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    @patch('requests.Session.get')
-    def test_valid_token_validation(self, mock_get):
+    def test_valid_token_validation(self, github_client, mock_get):
         """Test successful token validation."""
         # Mock successful API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'login': 'testuser'}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(200, {'login': 'testuser'})
         
-        result = self.client.validate_token()
+        result = github_client.validate_token()
         
         assert result is True
-        mock_get.assert_called_once_with("https://api.github.com/user")
-    
-    @patch('requests.Session.get')
-    def test_invalid_token_handling(self, mock_get):
-        """Test handling of invalid authentication token."""
-        # Mock 401 Unauthorized response
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_get.return_value = mock_response
-        
-        with pytest.raises(GitHubAuthenticationError, match="Invalid GitHub token"):
-            self.client.validate_token()
-    
-    @patch('requests.Session.get')
-    def test_rate_limit_during_validation(self, mock_get):
-        """Test rate limit handling during token validation."""
-        # Mock 403 Forbidden response (rate limited)
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_get.return_value = mock_response
-        
-        with pytest.raises(GitHubRateLimitError, match="GitHub API rate limit exceeded"):
-            self.client.validate_token()
-    
-    @patch('requests.Session.get')
-    def test_api_error_during_validation(self, mock_get):
-        """Test other API errors during token validation."""
-        # Mock 500 Internal Server Error response
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_get.return_value = mock_response
-        
-        with pytest.raises(GitHubAPIError, match="API request failed: 500"):
-            self.client.validate_token()
-    
-    @patch('requests.Session.get')
-    def test_connection_error_during_validation(self, mock_get):
+        assert mock_get.call_count == 1
+        assert mock_get.call_args == (("https://api.github.com/user",), {})
+    
+    @pytest.mark.parametrize("code,exc,msg", [
+        (401, GitHubAuthenticationError, "Invalid GitHub token"),
+        (403, GitHubRateLimitError, "GitHub API rate limit exceeded"),
+        (500, GitHubAPIError, "API request failed: 500"),
+    ])
+    def test_validate_token_errors(self, github_client, mock_get, code, exc, msg):
+        """Test error responses during token validation."""
+        mock_get.return_value = make_response(code)
+        
+        with pytest.raises(exc) as exc_info:
+            github_client.validate_token()
+        assert msg in str(exc_info.value)
+    
+    def test_connection_error_during_validation(self, github_client, mock_get):
         """Test network connection errors during token validation."""
         # Mock requests.RequestException
-        mock_get.side_effect = requests.ConnectionError("Connection failed")
+        mock_get.side_effect = _CONN_ERR
         
-        with pytest.raises(GitHubAPIError, match="Failed to connect to GitHub API"):
-            self.client.validate_token()
+        with pytest.raises(GitHubAPIError) as exc_info:
+            github_client.validate_token()
+        assert "Failed to connect to GitHub API" in str(exc_info.value)
 
 
 class TestRepositoryValidation:
     """Test cases for repository access validation."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    @patch('requests.Session.get')
-    def test_repository_validation_success(self, mock_get):
+    def test_repository_validation_success(self, github_client, mock_get):
         """Test successful repository access validation."""
         # Mock successful repository response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            'name': 'test-repo',
-            'full_name': 'testowner/test-repo',
-            'private': False,
-            'default_branch': 'main',
-            'created_at': '2023-01-01T00:00:00Z',
-            'updated_at': '2023-12-01T00:00:00Z'
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(200, _REPO_INFO)
         
-        repo_info = self.client.get_repository_info("testowner", "test-repo")
+        repo_info = github_client.get_repository_info("testowner", "test-repo")
         
-        expected_info = {
-            'name': 'test-repo',
-            'full_name': 'testowner/test-repo',
-            'private': False,
-            'default_branch': 'main',
-            'created_at': '2023-01-01T00:00:00Z',
-            'updated_at': '2023-12-01T00:00:00Z'
-        }
-        
-        assert repo_info == expected_info
-        mock_get.assert_called_once_with("https://api.github.com/repos/testowner/test-repo")
-    
-    @patch('requests.Session.get')
-    def test_repository_not_found(self, mock_get):
-        """Test handling of non-existent or inaccessible repository."""
-        # Mock 404 Not Found response
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_get.return_value = mock_response
-        
-        with pytest.raises(GitHubAPIError, match="Repository testowner/test-repo not found or not accessible"):
-            self.client.get_repository_info("testowner", "test-repo")
+        assert repo_info == _REPO_INFO
+        assert mock_get.call_count == 1
+        assert mock_get.call_args == (("https://api.github.com/repos/testowner/test-repo",), {})
     
-    @patch('requests.Session.get')
-    def test_repository_rate_limited(self, mock_get):
-        """Test rate limiting during repository validation."""
-        # Mock 403 Forbidden response (rate limited)
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_get.return_value = mock_response
-        
-        with pytest.raises(GitHubRateLimitError, match="GitHub API rate limit exceeded"):
-            self.client.get_repository_info("testowner", "test-repo")
-    
-    @patch('requests.Session.get')
-    def test_repository_api_error(self, mock_get):
-        """Test other API errors during repository validation."""
-        # Mock 500 Internal Server Error response
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_get.return_value = mock_response
-        
-        with pytest.raises(GitHubAPIError, match="Failed to fetch repository info: 500"):
-            self.client.get_repository_info("testowner", "test-repo")
+    @pytest.mark.parametrize("code,exc,msg", [
+        (404, GitHubAPIError, "Repository testowner/test-repo not found or not accessible"),
+        (403, GitHubRateLimitError, "GitHub API rate limit exceeded"),
+        (500, GitHubAPIError, "Failed to fetch repository info: 500"),
+    ])
+    def test_repository_errors(self, github_client, mock_get, code, exc, msg):
+        """Test error responses during repository validation."""
+        mock_get.return_value = make_response(code)
+        
+        with pytest.raises(exc) as exc_info:
+            github_client.get_repository_info("testowner", "test-repo")
+        assert msg in str(exc_info.value)
     
-    @patch('requests.Session.get')
-    def test_repository_connection_error(self, mock_get):
+    def test_repository_connection_error(self, github_client, mock_get):
         """Test network connection errors during repository validation."""
         # Mock requests.RequestException
-        mock_get.side_effect = requests.ConnectionError("Connection failed")
+        mock_get.side_effect = _CONN_ERR
         
-        with pytest.raises(GitHubAPIError, match="Failed to fetch repository information"):
-            self.client.get_repository_info("testowner", "test-repo")
+        with pytest.raises(GitHubAPIError) as exc_info:
+            github_client.get_repository_info("testowner", "test-repo")
+        assert "Failed to fetch repository information" in str(exc_info.value)
 
 
 class TestRateLimitHandling:
     """Test cases for GitHub API rate limiting scenarios."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    @patch('requests.Session.get')
-    def test_rate_limit_handling(self, mock_get):
-        """Test rate limit detection and error handling."""
-        # Mock rate limited response
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.headers = {
-            'X-RateLimit-Remaining': '0',
-            'X-RateLimit-Reset': '1640995200'  # Example timestamp
-        }
-        mock_get.return_value = mock_response
-        
-        with pytest.raises(GitHubRateLimitError, match="GitHub API rate limit exceeded"):
-            self.client._make_api_request("https://api.github.com/test")
-    
-    @patch('requests.Session.get')
-    def test_rate_limit_logging(self, mock_get):
+    @pytest.mark.parametrize("headers,exc,msg", [
+        # Rate limited: no requests remaining until the reset timestamp
+        (_DEPLETED_RL_HEADERS,
+         GitHubRateLimitError, "GitHub API rate limit exceeded"),
+        # 403 that's not due to rate limiting
+        ({}, GitHubAPIError, "API request failed: 403"),
+    ], ids=["rate_limited", "forbidden"])
+    def test_403_handling(self, github_client, mock_get, headers, exc, msg):
+        """Test 403 responses with and without rate limit exhaustion."""
+        mock_get.return_value = make_response(403, headers=headers, text="Forbidden")
+        
+        with pytest.raises(exc) as exc_info:
+            github_client._make_api_request("https://api.github.com/test")
+        assert msg in str(exc_info.value)
+    
+    def test_rate_limit_logging(self, github_client, mock_get, caplog):
         """Test rate limit status logging."""
         # Mock successful response with rate limit headers
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {
-            'X-RateLimit-Remaining': '4999',
-            'X-RateLimit-Limit': '5000'
-        }
-        mock_response.json.return_value = {'test': 'data'}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(200, {'test': 'data'}, _4999_OF_5000)
         
-        with patch.object(self.client.logger, 'debug') as mock_debug:
-            result = self.client._make_api_request("https://api.github.com/test")
-            
-            assert result == {'test': 'data'}
-            mock_debug.assert_called_with("API rate limit: 4999/5000 remaining")
-    
-    @patch('requests.Session.get')
-    def test_403_without_rate_limit(self, mock_get):
-        """Test 403 response that's not due to rate limiting."""
-        # Mock 403 response without rate limit headers
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.headers = {}
-        mock_response.text = "Forbidden"
-        mock_get.return_value = mock_response
-        
-        with pytest.raises(GitHubAPIError, match="API request failed: 403"):
-            self.client._make_api_request("https://api.github.com/test")
+        caplog.set_level(logging.DEBUG, logger="github_client")
+        result = github_client._make_api_request("https://api.github.com/test")
+        
+        assert result == {'test': 'data'}
+        assert "API rate limit: 4999/5000 remaining" in caplog.messages
 
 
 class TestAPIRequestHandling:
     """Test cases for general API request handling."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    @patch('requests.Session.get')
-    def test_successful_api_request(self, mock_get):
+    def test_successful_api_request(self, github_client, mock_get):
         """Test successful API request handling."""
         # Mock successful API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'data': 'test'}
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(200, {'data': 'test'})
         
-        result = self.client._make_api_request("https://api.github.com/test")
+        result = github_client._make_api_request("https://api.github.com/test")
         
         assert result == {'data': 'test'}
-        mock_get.assert_called_once_with("https://api.github.com/test", params=None)
+        args, kwargs = mock_get.call_args
+        assert mock_get.call_count == 1
+        assert args == ("https://api.github.com/test",)
+        assert kwargs['params'] is None
     
-    @patch('requests.Session.get')
-    def test_api_request_with_params(self, mock_get):
+    def test_api_request_with_params(self, github_client, mock_get):
         """Test API request with query parameters."""
         # Mock successful API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {'data': 'test'}
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(200, {'data': 'test'})
         
         params = {'per_page': 100, 'state': 'all'}
-        result = self.client._make_api_request("https://api.github.com/test", params)
+        result = github_client._make_api_request("https://api.github.com/test", params)
         
         assert result == {'data': 'test'}
-        mock_get.assert_called_once_with("https://api.github.com/test", params=params)
+        args, kwargs = mock_get.call_args
+        assert mock_get.call_count == 1
+        assert args == ("https://api.github.com/test",)
+        assert kwargs['params'] == params
     
-    @patch('requests.Session.get')
-    def test_expired_token_handling(self, mock_get):
+    def test_response_body_decoded_with_orjson(self, github_client, mock_get):
+        """Test raw response bytes are decoded with orjson when it is installed."""
+        pytest.importorskip("orjson")
+        response = make_response(200, content=b'{"data": "test"}')
+        response.json = Mock(side_effect=AssertionError("stdlib decoding should be skipped"))
+        mock_get.return_value = response
+        
+        result = github_client._make_api_request("https://api.github.com/test")
+        
+        assert result == {'data': 'test'}
+    
+    def test_not_modified_returns_cached_response(self, mock_get):
+        """Test a 304 reply to a conditional request returns the cached data."""
+        # Fresh client so the ETag cache isn't shared with other tests
+        client = GitHubClient("test_token")
+        mock_get.side_effect = [
+            make_response(200, {'data': 'test'}, {'ETag': '"abc123"'}, content=b'{"data": "test"}'),
+            make_response(304, headers=_FULL_RL_HEADERS),
+        ]
+        
+        first = client._make_api_request("https://api.github.com/test", {'page': 1})
+        second = client._make_api_request("https://api.github.com/test", {'page': 1})
+        
+        assert first == second == {'data': 'test'}
+        _, first_kwargs = mock_get.call_args_list[0]
+        _, second_kwargs = mock_get.call_args_list[1]
+        assert 'headers' not in first_kwargs
+        assert second_kwargs['headers'] == {'If-None-Match': '"abc123"'}
+        client.session.close()
+    
+    def test_not_modified_result_unaffected_by_caller_mutation(self, github_client, mock_get):
+        """Test mutating an earlier result does not leak into a later 304 result."""
+        mock_get.side_effect = [
+            make_response(200, None, {'ETag': '"abc123"'}, content=b'[{"number": 1}]'),
+            make_response(304, headers=_FULL_RL_HEADERS),
+        ]
+        
+        first = github_client._make_api_request("https://api.github.com/test")
+        first.append({'number': 2})
+        first[0]['annotated'] = True
+        second = github_client._make_api_request("https://api.github.com/test")
+        
+        assert second == [{'number': 1}]
+    
+    def test_etag_cache_bounded_by_bytes(self, github_client, mock_get, monkeypatch):
+        """Test least recently used bodies are evicted once the byte budget is exceeded."""
+        monkeypatch.setattr(github_client, 'ETAG_CACHE_MAX_BYTES', 20)
+        mock_get.side_effect = [
+            make_response(200, None, {'ETag': f'"{i}"'}, content=b'{"data": "1234"}')
+            for i in range(2)
+        ]
+        
+        github_client._make_api_request("https://api.github.com/a")
+        github_client._make_api_request("https://api.github.com/b")
+        
+        assert list(github_client._etag_cache) == [("https://api.github.com/b", ())]
+        assert github_client._etag_cache_bytes == len(b'{"data": "1234"}')
+    
+    def test_expired_token_handling(self, github_client, mock_get):
         """Test handling of expired authentication token."""
         # Mock 401 Unauthorized response
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.headers = {
-            'X-RateLimit-Remaining': '5000',
-            'X-RateLimit-Limit': '5000',
-            'X-RateLimit-Reset': '1640995200',
-            'X-RateLimit-Used': '0'
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(401, headers=_FULL_RL_HEADERS)
         
-        with pytest.raises(GitHubAuthenticationError, match="GitHub token is invalid or expired"):
-            self.client._make_api_request("https://api.github.com/test")
+        with pytest.raises(GitHubAuthenticationError) as exc_info:
+            github_client._make_api_request("https://api.github.com/test")
+        assert "GitHub token is invalid or expired" in str(exc_info.value)
     
-    @patch('requests.Session.get')
-    def test_connection_error_in_api_request(self, mock_get):
+    def test_connection_error_in_api_request(self, github_client, mock_get):
         """Test connection error handling in API requests."""
         # Mock requests.RequestException
-        mock_get.side_effect = requests.ConnectionError("Connection failed")
+        mock_get.side_effect = _CONN_ERR
         
-        with pytest.raises(GitHubAPIError, match="GitHub API request to .* failed after .* attempts"):
-            self.client._make_api_request("https://api.github.com/test")
+        with pytest.raises(GitHubAPIError, match=_RETRIES_EXHAUSTED):
+            github_client._make_api_request("https://api.github.com/test")
 
 
 class TestLoggingSetup:
     """Test cases for logging configuration."""
     
-    def test_setup_logging_default_level(self):
+    def test_setup_logging_default_level(self, monkeypatch):
         """Test logging setup with default INFO level."""
-        with patch('logging.basicConfig') as mock_config:
-            setup_logging()
-            
-            mock_config.assert_called_once_with(
-                level=20,  # logging.INFO
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
+        calls = []
+        monkeypatch.setattr(logging, 'basicConfig', lambda **kwargs: calls.append(kwargs))
+        
+        setup_logging()
+        
+        assert calls == [{
+            'level': 20,  # logging.INFO
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            'datefmt': '%Y-%m-%d %H:%M:%S'
+        }]
     
-    def test_setup_logging_custom_level(self):
+    def test_setup_logging_custom_level(self, monkeypatch):
         """Test logging setup with custom DEBUG level."""
-        with patch('logging.basicConfig') as mock_config:
-            setup_logging("DEBUG")
-            
-            mock_config.assert_called_once_with(
-                level=10,  # logging.DEBUG
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
+        calls = []
+        monkeypatch.setattr(logging, 'basicConfig', lambda **kwargs: calls.append(kwargs))
+        
+        setup_logging("DEBUG")
+        
+        assert calls == [{
+            'level': 10,  # logging.DEBUG
+            'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            'datefmt': '%Y-%m-%d %H:%M:%S'
+        }]
 
 
 # Test fixtures and utility functions
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Skip the real retry backoff sleeps in _make_api_request."""
+    monkeypatch.setattr('github_client.time.sleep', lambda *_: None)
+
+
 @pytest.fixture
 def mock_github_response():
     """Fixture providing a mock GitHub API response."""
-    response = Mock()
-    response.status_code = 200
-    response.headers = {}
-    response.json.return_value = {'test': 'data'}
-    return response
+    return make_response(200, {'test': 'data'})
 
 
-@pytest.fixture
-def github_client():
-    """Fixture providing a GitHubClient instance for testing."""
-    return GitHubClient("test_token")
+# Paginated API payloads: a full first page of _PAGE_SIZE followed by a short last page
+_PAGE_SIZE = 2
+
+
+@pytest.fixture(scope="session")
+def pr_pages():
+    """Two pages of pull requests, built once per session."""
+    return (
+        tuple({'number': i, 'created_at': '2024-12-01T10:00:00Z'} for i in range(1, 3)),
+        tuple({'number': i, 'created_at': '2024-12-01T10:00:00Z'} for i in range(3, 4)),
+    )
+
+
+@pytest.fixture(scope="session")
+def commit_pages():
+    """Two pages of commits, built once per session."""
+    return (
+        tuple({'sha': f'commit{i}', 'commit': {'author': {'date': '2024-12-01T10:00:00Z'}}}
+              for i in range(1, 3)),
+        tuple({'sha': f'commit{i}', 'commit': {'author': {'date': '2024-12-01T10:00:00Z'}}}
+              for i in range(3, 4)),
+    )
+
+
+@pytest.fixture(scope="session")
+def timeline_pages():
+    """Two pages of timeline events, built once per session."""
+    return (
+        tuple({'event': f'event{i}', 'created_at': '2024-12-01T10:00:00Z'} for i in range(1, 3)),
+        tuple({'event': f'event{i}', 'created_at': '2024-12-01T10:00:00Z'} for i in range(3, 4)),
+    )
 
 
 class TestPullRequestFetching:
     """Test cases for pull request data fetching."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    @patch('requests.Session.get')
-    def test_pr_fetching_date_filtering(self, mock_get):
+    def test_pr_fetching_date_filtering(self, github_client, mock_get):
         """Test PR fetching with date filtering and range calculations."""
         # Mock PR data with different creation dates
         mock_prs = [
@@ -400,58 +446,33 @@ class TestPullRequestFetching:
         ]
         
         # Mock successful API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_prs
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(200, mock_prs)
         
         # Test date range calculation
-        from datetime import datetime, timedelta
-        test_date = datetime(2024, 11, 20)
+        test_date = _NOV_20
         
-        with patch('github_client.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2024, 12, 20)
-            mock_datetime.fromisoformat = datetime.fromisoformat
-            
-            # Test the actual method
-            result = self.client.get_pull_requests("testowner", "test-repo", test_date)
-            
-            # Should return only PRs created after test_date
-            assert len(result) == 1
-            assert result[0]['number'] == 1
-            assert result[0]['created_at'] == '2024-12-01T10:00:00Z'
+        # Test the actual method
+        result = github_client.get_pull_requests("testowner", "test-repo", test_date)
+        
+        # Should return only PRs created after test_date
+        assert len(result) == 1
+        assert result[0]['number'] == 1
+        assert result[0]['created_at'] == '2024-12-01T10:00:00Z'
     
-    @patch('requests.Session.get')
-    def test_pr_pagination_handling(self, mock_get):
+    def test_pr_pagination_handling(self, github_client, monkeypatch, pr_pages):
         """Test pagination handling for large PR lists."""
-        # Mock first page of PRs
-        first_page = [{'number': i, 'created_at': '2024-12-01T10:00:00Z'} for i in range(1, 101)]
+        # Second page has fewer than per_page PRs to indicate last page
+        monkeypatch.setattr(github_client, '_make_api_request', paged(pr_pages))
+        test_date = _NOV_1
         
-        # Mock second page of PRs (fewer than per_page to indicate last page)
-        second_page = [{'number': i, 'created_at': '2024-12-01T10:00:00Z'} for i in range(101, 150)]
+        result = github_client.get_pull_requests("testowner", "test-repo", test_date, per_page=_PAGE_SIZE)
         
-        responses = [first_page, second_page]
-        
-        def mock_api_request(url, params=None):
-            page = params.get('page', 1) if params else 1
-            if page <= len(responses):
-                return responses[page - 1]
-            return []
-        
-        with patch.object(self.client, '_make_api_request', side_effect=mock_api_request):
-            from datetime import datetime
-            test_date = datetime(2024, 11, 1)
-            
-            result = self.client.get_pull_requests("testowner", "test-repo", test_date)
-            
-            # Should return all PRs from both pages
-            assert len(result) == 149
-            assert result[0]['number'] == 1
-            assert result[-1]['number'] == 149
+        # Should return all PRs from both pages
+        assert len(result) == 3
+        assert result[0]['number'] == 1
+        assert result[-1]['number'] == 3
     
-    @patch('requests.Session.get')
-    def test_get_pr_details_success(self, mock_get):
+    def test_get_pr_details_success(self, github_client, monkeypatch):
         """Test successful PR details fetching."""
         mock_pr_data = {
             'number': 123,
@@ -464,54 +485,35 @@ class TestPullRequestFetching:
             'head': {'ref': 'feature-branch'}
         }
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_pr_data
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        monkeypatch.setattr(github_client, '_make_api_request', Mock(return_value=mock_pr_data))
+        result = github_client.get_pr_details("testowner", "test-repo", 123)
         
-        with patch.object(self.client, '_make_api_request', return_value=mock_pr_data):
-            result = self.client.get_pr_details("testowner", "test-repo", 123)
-            
-            assert result['number'] == 123
-            assert result['title'] == 'Test PR'
-            assert result['merged_at'] == '2024-12-02T15:30:00Z'
+        assert result['number'] == 123
+        assert result['title'] == 'Test PR'
+        assert result['merged_at'] == '2024-12-02T15:30:00Z'
     
-    @patch('requests.Session.get')
-    def test_get_pr_details_not_found(self, mock_get):
+    def test_get_pr_details_not_found(self, github_client, monkeypatch):
         """Test PR details fetching for non-existent PR."""
-        with patch.object(self.client, '_make_api_request', side_effect=GitHubAPIError("API request failed: 404")):
-            with pytest.raises(GitHubAPIError, match="Pull request #999 not found in testowner/test-repo"):
-                self.client.get_pr_details("testowner", "test-repo", 999)
+        monkeypatch.setattr(github_client, '_make_api_request', Mock(side_effect=GitHubAPIError("API request failed: 404")))
+        with pytest.raises(GitHubAPIError) as exc_info:
+            github_client.get_pr_details("testowner", "test-repo", 999)
+        assert "Pull request #999 not found in testowner/test-repo" in str(exc_info.value)
     
     def test_calculate_date_range(self):
         """Test date range calculations for different time periods."""
         # Test 1 month back
-        with patch('github_client.datetime') as mock_datetime:
-            mock_now = datetime(2024, 12, 20, 15, 30, 45, 123456)
-            mock_datetime.now.return_value = mock_now
-            
-            from dateutil.relativedelta import relativedelta
-            expected_date = mock_now.replace(microsecond=0) - relativedelta(months=1)
-            
-            result = self.client._calculate_date_range(1)
-            
-            assert result == expected_date
+        client = GitHubClient("test_token", clock=lambda: _FIXED_NOW)
+        expected_date = _FIXED_NOW.replace(microsecond=0) - _ONE_MONTH
+        
+        assert client._calculate_date_range(1) == expected_date
         
         # Test 3 months back
-        with patch('github_client.datetime') as mock_datetime:
-            mock_now = datetime(2024, 12, 20, 10, 0, 0)
-            mock_datetime.now.return_value = mock_now
-            
-            from dateutil.relativedelta import relativedelta
-            expected_date = mock_now - relativedelta(months=3)
-            
-            result = self.client._calculate_date_range(3)
-            
-            assert result == expected_date
+        client = GitHubClient("test_token", clock=lambda: _DEC_20)
+        expected_date = _DEC_20 - _THREE_MONTHS
+        
+        assert client._calculate_date_range(3) == expected_date
     
-    @patch('requests.Session.get')
-    def test_pr_fetching_with_early_termination(self, mock_get):
+    def test_pr_fetching_with_early_termination(self, github_client, monkeypatch):
         """Test that PR fetching stops when encountering PRs older than since_date."""
         # Mock PRs where some are too old
         mock_prs_page1 = [
@@ -522,73 +524,61 @@ class TestPullRequestFetching:
         def mock_api_request(url, params=None):
             return mock_prs_page1
         
-        with patch.object(self.client, '_make_api_request', side_effect=mock_api_request):
-            from datetime import datetime
-            test_date = datetime(2024, 11, 15)  # Date between the two PRs
-            
-            result = self.client.get_pull_requests("testowner", "test-repo", test_date)
-            
-            # Should only return the recent PR and stop pagination
-            assert len(result) == 1
-            assert result[0]['number'] == 1
+        monkeypatch.setattr(github_client, '_make_api_request', mock_api_request)
+        test_date = _NOV_15  # Date between the two PRs
+        
+        result = github_client.get_pull_requests("testowner", "test-repo", test_date)
+        
+        # Should only return the recent PR and stop pagination
+        assert len(result) == 1
+        assert result[0]['number'] == 1
 
 
 class TestReviewDataFetching:
     """Test cases for review data fetching methods."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    @patch('requests.Session.get')
-    def test_review_data_fetching(self, mock_get):
+    def test_review_data_fetching(self, github_client, monkeypatch):
         """Test PR reviews fetching."""
         mock_reviews = [
             {'id': 1, 'state': 'APPROVED', 'submitted_at': '2024-12-01T10:30:00Z'},
             {'id': 2, 'state': 'CHANGES_REQUESTED', 'submitted_at': '2024-12-01T14:00:00Z'}
         ]
         
-        with patch.object(self.client, '_make_api_request', return_value=mock_reviews):
-            result = self.client.get_pr_reviews("testowner", "test-repo", 123)
-            
-            assert len(result) == 2
-            assert result[0]['state'] == 'APPROVED'
-            assert result[1]['state'] == 'CHANGES_REQUESTED'
+        monkeypatch.setattr(github_client, '_make_api_request', Mock(return_value=mock_reviews))
+        result = github_client.get_pr_reviews("testowner", "test-repo", 123)
+        
+        assert len(result) == 2
+        assert result[0]['state'] == 'APPROVED'
+        assert result[1]['state'] == 'CHANGES_REQUESTED'
     
-    @patch('requests.Session.get')
-    def test_review_comments_fetching(self, mock_get):
+    def test_review_comments_fetching(self, github_client, monkeypatch):
         """Test PR review comments fetching."""
         mock_comments = [
             {'id': 1, 'body': 'This looks good', 'created_at': '2024-12-01T11:00:00Z'},
             {'id': 2, 'body': 'Please fix this', 'created_at': '2024-12-01T15:30:00Z'}
         ]
         
-        with patch.object(self.client, '_make_api_request', return_value=mock_comments):
-            result = self.client.get_pr_review_comments("testowner", "test-repo", 123)
-            
-            assert len(result) == 2
-            assert result[0]['body'] == 'This looks good'
-            assert result[1]['body'] == 'Please fix this'
+        monkeypatch.setattr(github_client, '_make_api_request', Mock(return_value=mock_comments))
+        result = github_client.get_pr_review_comments("testowner", "test-repo", 123)
+        
+        assert len(result) == 2
+        assert result[0]['body'] == 'This looks good'
+        assert result[1]['body'] == 'Please fix this'
     
-    @patch('requests.Session.get')
-    def test_review_data_not_found(self, mock_get):
+    def test_review_data_not_found(self, github_client, monkeypatch):
         """Test handling of PR not found for review data."""
-        with patch.object(self.client, '_make_api_request', side_effect=GitHubAPIError("API request failed: 404")):
-            reviews = self.client.get_pr_reviews("testowner", "test-repo", 999)
-            comments = self.client.get_pr_review_comments("testowner", "test-repo", 999)
-            
-            assert reviews == []
-            assert comments == []
+        monkeypatch.setattr(github_client, '_make_api_request', Mock(side_effect=GitHubAPIError("API request failed: 404")))
+        reviews = github_client.get_pr_reviews("testowner", "test-repo", 999)
+        comments = github_client.get_pr_review_comments("testowner", "test-repo", 999)
+        
+        assert reviews == []
+        assert comments == []
 
 
 class TestMergeDataFetching:
     """Test cases for merge information fetching."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    def test_merge_info_for_merged_pr(self):
+    def test_merge_info_for_merged_pr(self, github_client):
         """Test merge info fetching for merged PR."""
         mock_pr_data = {
             'number': 123,
@@ -598,15 +588,15 @@ class TestMergeDataFetching:
             'merged': True
         }
         
-        with patch.object(self.client, 'get_pr_details', return_value=mock_pr_data):
-            result = self.client.get_pr_merge_info("testowner", "test-repo", 123)
+        with patch.object(github_client, 'get_pr_details', autospec=True, return_value=mock_pr_data):
+            result = github_client.get_pr_merge_info("testowner", "test-repo", 123)
             
             assert result is not None
             assert result['merged_at'] == '2024-12-02T10:30:00Z'
             assert result['merged_by']['login'] == 'testuser'
             assert result['merged'] is True
     
-    def test_merge_info_for_unmerged_pr(self):
+    def test_merge_info_for_unmerged_pr(self, github_client):
         """Test merge info fetching for unmerged PR."""
         mock_pr_data = {
             'number': 123,
@@ -614,8 +604,8 @@ class TestMergeDataFetching:
             'merged': False
         }
         
-        with patch.object(self.client, 'get_pr_details', return_value=mock_pr_data):
-            result = self.client.get_pr_merge_info("testowner", "test-repo", 123)
+        with patch.object(github_client, 'get_pr_details', autospec=True, return_value=mock_pr_data):
+            result = github_client.get_pr_merge_info("testowner", "test-repo", 123)
             
             assert result is None
 
@@ -623,12 +613,7 @@ class TestMergeDataFetching:
 class TestCommitDataFetching:
     """Test cases for commit data fetching and timestamp parsing."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    @patch('requests.Session.get')
-    def test_commit_data_fetching(self, mock_get):
+    def test_commit_data_fetching(self, github_client, monkeypatch):
         """Test PR commits fetching."""
         mock_commits = [
             {
@@ -649,49 +634,27 @@ class TestCommitDataFetching:
             }
         ]
         
-        with patch.object(self.client, '_make_api_request', return_value=mock_commits):
-            result = self.client.get_pr_commits("testowner", "test-repo", 123)
-            
-            assert len(result) == 2
-            assert result[0]['sha'] == 'abc123'
-            assert result[1]['sha'] == 'def456'
+        monkeypatch.setattr(github_client, '_make_api_request', Mock(return_value=mock_commits))
+        result = github_client.get_pr_commits("testowner", "test-repo", 123)
+        
+        assert len(result) == 2
+        assert result[0]['sha'] == 'abc123'
+        assert result[1]['sha'] == 'def456'
     
-    @patch('requests.Session.get')
-    def test_commit_pagination(self, mock_get):
+    def test_commit_pagination(self, github_client, monkeypatch, commit_pages):
         """Test commit fetching with pagination."""
-        # Mock first page of commits
-        first_page = [{'sha': f'commit{i}', 'commit': {'author': {'date': '2024-12-01T10:00:00Z'}}} 
-                     for i in range(1, 101)]
-        
-        # Mock second page (smaller)
-        second_page = [{'sha': f'commit{i}', 'commit': {'author': {'date': '2024-12-01T10:00:00Z'}}} 
-                      for i in range(101, 120)]
-        
-        responses = [first_page, second_page]
+        monkeypatch.setattr(github_client, '_make_api_request', paged(commit_pages))
+        result = github_client.get_pr_commits("testowner", "test-repo", 123, per_page=_PAGE_SIZE)
         
-        def mock_api_request(url, params=None):
-            page = params.get('page', 1) if params else 1
-            if page <= len(responses):
-                return responses[page - 1]
-            return []
-        
-        with patch.object(self.client, '_make_api_request', side_effect=mock_api_request):
-            result = self.client.get_pr_commits("testowner", "test-repo", 123)
-            
-            assert len(result) == 119
-            assert result[0]['sha'] == 'commit1'
-            assert result[-1]['sha'] == 'commit119'
+        assert len(result) == 3
+        assert result[0]['sha'] == 'commit1'
+        assert result[-1]['sha'] == 'commit3'
 
 
 class TestTimelineDataParsing:
     """Test cases for timeline event parsing."""
     
-    def setup_method(self):
-        """Set up test client for each test method."""
-        self.client = GitHubClient("test_token")
-    
-    @patch('requests.Session.get')
-    def test_timeline_data_parsing(self, mock_get):
+    def test_timeline_data_parsing(self, github_client, mock_get):
         """Test timeline event fetching and parsing."""
         mock_timeline = [
             {'event': 'reviewed', 'created_at': '2024-12-01T10:30:00Z', 'actor': {'login': 'reviewer'}},
@@ -699,101 +662,136 @@ class TestTimelineDataParsing:
         ]
         
         # Mock the session.get call for timeline API
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_timeline
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(200, mock_timeline)
         
-        result = self.client.get_pr_timeline("testowner", "test-repo", 123)
+        result = github_client.get_pr_timeline("testowner", "test-repo", 123)
         
         assert len(result) == 2
         assert result[0]['event'] == 'reviewed'
         assert result[1]['event'] == 'merged'
     
-    @patch('requests.Session.get')
-    def test_timeline_not_found(self, mock_get):
+    def test_timeline_not_found(self, github_client, mock_get):
         """Test timeline fetching for non-existent PR."""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.headers = {
-            'X-RateLimit-Remaining': '5000',
-            'X-RateLimit-Limit': '5000',
-            'X-RateLimit-Reset': '1640995200',
-            'X-RateLimit-Used': '0'
-        }
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(404, headers=_FULL_RL_HEADERS)
         
-        result = self.client.get_pr_timeline("testowner", "test-repo", 999)
+        result = github_client.get_pr_timeline("testowner", "test-repo", 999)
         
         assert result == []
     
-    @patch('requests.Session.get')
-    def test_timeline_pagination(self, mock_get):
+    def test_timeline_pagination(self, github_client, mock_get, timeline_pages):
         """Test timeline fetching with pagination."""
-        # First page
-        first_page_events = [{'event': f'event{i}', 'created_at': '2024-12-01T10:00:00Z'} 
-                            for i in range(1, 101)]
-        
-        # Second page (smaller, indicating end)
-        second_page_events = [{'event': f'event{i}', 'created_at': '2024-12-01T10:00:00Z'} 
-                             for i in range(101, 110)]
-        
-        def mock_session_get(*args, **kwargs):
-            params = kwargs.get('params', {})
-            page = params.get('page', 1)
-            
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.headers = {}
-            
-            if page == 1:
-                mock_response.json.return_value = first_page_events
-            elif page == 2:
-                mock_response.json.return_value = second_page_events
-            else:
-                mock_response.json.return_value = []
-            
-            return mock_response
-        
-        mock_get.side_effect = mock_session_get
+        fetch = paged(timeline_pages)
+        mock_get.side_effect = lambda url, params=None, **kwargs: make_response(200, fetch(url, params))
         
-        result = self.client.get_pr_timeline("testowner", "test-repo", 123)
+        result = github_client.get_pr_timeline("testowner", "test-repo", 123, per_page=_PAGE_SIZE)
         
-        assert len(result) == 109
+        assert len(result) == 3
         assert result[0]['event'] == 'event1'
-        assert result[-1]['event'] == 'event109'
+        assert result[-1]['event'] == 'event3'
+    
+    def test_timeline_pagination_with_last_page_link(self, github_client, mock_get, timeline_pages):
+        """Test pages after the first are fetched up to the Link header's last page."""
+        fetch = paged(timeline_pages)
+        link = {'Link': '<https://api.github.com/repositories/1/issues/123/timeline?per_page=2&page=2>; rel="next", '
+                        '<https://api.github.com/repositories/1/issues/123/timeline?per_page=2&page=2>; rel="last"'}
+        
+        def respond(url, params=None, **kwargs):
+            return make_response(200, fetch(url, params), link if params['page'] == 1 else None)
+        mock_get.side_effect = respond
+        
+        result = github_client.get_pr_timeline("testowner", "test-repo", 123, per_page=_PAGE_SIZE)
+        
+        assert [event['event'] for event in result] == ['event1', 'event2', 'event3']
+        # No probe for an empty page past the advertised last page
+        assert mock_get.call_count == 2
+    
+    def test_timeline_concurrent_pages_keep_page_order(self, github_client, mock_get):
+        """Test pages finishing out of order are still assembled in page order."""
+        last_page = 5
+        link = {'Link': f'<https://api.github.com/repositories/1/issues/123/timeline?per_page=2&page={last_page}>; rel="last"'}
+        # Each page after the first waits for the next one, so pages complete last to first
+        finished = {page: threading.Event() for page in range(2, last_page + 2)}
+        finished[last_page + 1].set()
+        completion_order = []
+        
+        def respond(url, params=None, **kwargs):
+            page = params['page']
+            events = [{'event': f'event{page}-{i}'} for i in range(_PAGE_SIZE)]
+            if page == 1:
+                return make_response(200, events, link)
+            assert finished[page + 1].wait(timeout=5)
+            completion_order.append(page)
+            finished[page].set()
+            return make_response(200, events)
+        mock_get.side_effect = respond
+        
+        result = github_client.get_pr_timeline("testowner", "test-repo", 123, per_page=_PAGE_SIZE)
+        
+        assert completion_order == [5, 4, 3, 2]
+        assert [event['event'] for event in result] == [
+            f'event{page}-{i}' for page in range(1, last_page + 1) for i in range(_PAGE_SIZE)
+        ]
+    
+    def test_timeline_workers_keep_sessions_between_fetches(self, github_client, mock_get, monkeypatch):
+        """Test worker Sessions outlive a fan-out and are reused by the next one."""
+        link = {'Link': '<https://api.github.com/repositories/1/issues/123/timeline?per_page=2&page=3>; rel="last"'}
+        mock_close = Mock()
+        monkeypatch.setattr(requests.Session, 'close', mock_close)
+        sessions = []
+        
+        def respond(url, params=None, **kwargs):
+            events = [{'event': f"event{params['page']}-{i}"} for i in range(_PAGE_SIZE)]
+            if params['page'] == 1:
+                return make_response(200, events, link)
+            sessions.append(github_client._request_session())
+            return make_response(200, events)
+        mock_get.side_effect = respond
+        
+        github_client.get_pr_timeline("testowner", "test-repo", 123, per_page=_PAGE_SIZE)
+        first_sessions = list(github_client._worker_sessions)
+        github_client.get_pr_timeline("testowner", "test-repo", 123, per_page=_PAGE_SIZE)
+        
+        assert len(sessions) == 4
+        assert github_client.session not in sessions
+        assert set(sessions) <= set(github_client._worker_sessions)
+        assert github_client._worker_sessions[:len(first_sessions)] == first_sessions
+        mock_close.assert_not_called()
+    
+    def test_timeline_pages_serial_when_rate_limit_low(self, github_client, mock_get):
+        """Test remaining pages are fetched on the calling thread once the rate limit runs low."""
+        github_client._rate_limit_remaining = github_client.CONCURRENCY_MIN_RATE_LIMIT - 1
+        link = {'Link': '<https://api.github.com/repositories/1/issues/123/timeline?per_page=2&page=3>; rel="last"'}
+        threads = []
+        
+        def respond(url, params=None, **kwargs):
+            threads.append(threading.current_thread())
+            events = [{'event': f"event{params['page']}-{i}"} for i in range(_PAGE_SIZE)]
+            return make_response(200, events, link if params['page'] == 1 else None)
+        mock_get.side_effect = respond
+        
+        result = github_client.get_pr_timeline("testowner", "test-repo", 123, per_page=_PAGE_SIZE)
+        
+        assert threads == [threading.current_thread()] * 3
+        assert len(result) == 3 * _PAGE_SIZE
+        assert github_client._executor is None
 
 
 class TestReviewerDataFetching:
     """Test cases for reviewer request data fetching and processing."""
     
     @pytest.fixture
-    def mock_client(self):
-        """Create a GitHubClient with mocked session for testing."""
-        with patch('github_client.requests.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            mock_session.headers = {}
-            
-            client = GitHubClient("test_token")
-            client.session = mock_session
-            return client, mock_session
+    def mock_client(self, github_client):
+        """Provide a GitHubClient with mocked session for testing."""
+        mock_session = Mock(spec=requests.Session, headers={})
+        github_client.session = mock_session
+        return github_client, mock_session
     
     def test_get_pr_requested_reviewers_success(self, mock_client):
         """Test successful retrieval of requested reviewers for a PR."""
         client, mock_session = mock_client
         
         # Mock the API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {
-            'X-RateLimit-Remaining': '5000',
-            'X-RateLimit-Limit': '5000',
-            'X-RateLimit-Reset': '1640995200',
-            'X-RateLimit-Used': '0'
-        }
-        mock_response.json.return_value = {
+        mock_session.get.return_value = make_response(200, {
             'users': [
                 {'id': 1, 'login': 'reviewer1'},
                 {'id': 2, 'login': 'reviewer2'}
@@ -802,14 +800,16 @@ class TestReviewerDataFetching:
                 {'id': 10, 'slug': 'team-frontend', 'name': 'Frontend Team'},
                 {'id': 11, 'slug': 'team-backend', 'name': 'Backend Team'}
             ]
-        }
-        mock_session.get.return_value = mock_response
+        }, _FULL_RL_HEADERS)
         
         result = client.get_pr_requested_reviewers('owner', 'repo', 123)
         
         # Verify the API call
         expected_url = "https://api.github.com/repos/owner/repo/pulls/123/requested_reviewers"
-        mock_session.get.assert_called_once_with(expected_url, params=None)
+        args, kwargs = mock_session.get.call_args
+        assert mock_session.get.call_count == 1
+        assert args == (expected_url,)
+        assert kwargs['params'] is None
         
         # Verify the result structure
         assert 'users' in result
@@ -823,16 +823,7 @@ class TestReviewerDataFetching:
         """Test handling empty reviewer response."""
         client, mock_session = mock_client
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {
-            'X-RateLimit-Remaining': '5000',
-            'X-RateLimit-Limit': '5000',
-            'X-RateLimit-Reset': '1640995200',
-            'X-RateLimit-Used': '0'
-        }
-        mock_response.json.return_value = {'users': [], 'teams': []}
-        mock_session.get.return_value = mock_response
+        mock_session.get.return_value = make_response(200, {'users': [], 'teams': []}, _FULL_RL_HEADERS)
         
         result = client.get_pr_requested_reviewers('owner', 'repo', 123)
         
@@ -843,62 +834,48 @@ class TestReviewerDataFetching:
         """Test handling 404 response for requested reviewers."""
         client, mock_session = mock_client
         
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.text = "Not Found"
-        mock_session.get.return_value = mock_response
+        mock_session.get.return_value = make_response(404, text="Not Found")
         
         # Simulate the GitHubAPIError that would be raised by _make_api_request
-        with patch.object(client, '_make_api_request', side_effect=GitHubAPIError("404 Not Found")):
+        with patch.object(client, '_make_api_request', autospec=True, side_effect=GitHubAPIError("404 Not Found")):
             result = client.get_pr_requested_reviewers('owner', 'repo', 123)
             
             # Should return empty lists for 404
             assert result['users'] == []
             assert result['teams'] == []
     
-    def test_get_pr_requested_reviewers_invalid_params(self, mock_client):
+    @pytest.mark.parametrize("owner,repo,pr_number,msg", [
+        ('', 'repo', 123, "Repository owner and name are required"),
+        ('owner', '', 123, "Repository owner and name are required"),
+        ('owner', 'repo', 0, "Invalid PR number"),
+        ('owner', 'repo', -1, "Invalid PR number"),
+    ], ids=["missing_owner", "missing_repo", "zero_pr", "negative_pr"])
+    def test_get_pr_requested_reviewers_invalid_params(self, mock_client, owner, repo, pr_number, msg):
         """Test input validation for get_pr_requested_reviewers."""
         client, mock_session = mock_client
         
-        # Test missing owner
-        with pytest.raises(GitHubAPIError, match="Repository owner and name are required"):
-            client.get_pr_requested_reviewers('', 'repo', 123)
-        
-        # Test missing repo
-        with pytest.raises(GitHubAPIError, match="Repository owner and name are required"):
-            client.get_pr_requested_reviewers('owner', '', 123)
-        
-        # Test invalid PR number
-        with pytest.raises(GitHubAPIError, match="Invalid PR number"):
-            client.get_pr_requested_reviewers('owner', 'repo', 0)
-        
-        with pytest.raises(GitHubAPIError, match="Invalid PR number"):
-            client.get_pr_requested_reviewers('owner', 'repo', -1)
+        with pytest.raises(GitHubAPIError) as exc_info:
+            client.get_pr_requested_reviewers(owner, repo, pr_number)
+        assert msg in str(exc_info.value)
     
     def test_get_team_members_success(self, mock_client):
         """Test successful retrieval of team members."""
         client, mock_session = mock_client
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {
-            'X-RateLimit-Remaining': '5000',
-            'X-RateLimit-Limit': '5000',
-            'X-RateLimit-Reset': '1640995200',
-            'X-RateLimit-Used': '0'
-        }
-        mock_response.json.return_value = [
+        mock_session.get.return_value = make_response(200, [
             {'id': 1, 'login': 'member1'},
             {'id': 2, 'login': 'member2'},
             {'id': 3, 'login': 'member3'}
-        ]
-        mock_session.get.return_value = mock_response
+        ], _FULL_RL_HEADERS)
         
         result = client.get_team_members('myorg', 'team-slug')
         
         # Verify the API call
         expected_url = "https://api.github.com/orgs/myorg/teams/team-slug/members"
-        mock_session.get.assert_called_once_with(expected_url, params=None)
+        args, kwargs = mock_session.get.call_args
+        assert mock_session.get.call_count == 1
+        assert args == (expected_url,)
+        assert kwargs['params'] is None
         
         # Verify the result
         assert len(result) == 3
@@ -910,23 +887,23 @@ class TestReviewerDataFetching:
         client, mock_session = mock_client
         
         # Simulate the GitHubAPIError that would be raised by _make_api_request
-        with patch.object(client, '_make_api_request', side_effect=GitHubAPIError("404 Not Found")):
+        with patch.object(client, '_make_api_request', autospec=True, side_effect=GitHubAPIError("404 Not Found")):
             result = client.get_team_members('myorg', 'nonexistent-team')
             
             # Should return empty list for 404
             assert result == []
     
-    def test_get_team_members_invalid_params(self, mock_client):
+    @pytest.mark.parametrize("org,team_slug", [
+        ('', 'team-slug'),
+        ('myorg', ''),
+    ], ids=["missing_org", "missing_team_slug"])
+    def test_get_team_members_invalid_params(self, mock_client, org, team_slug):
         """Test input validation for get_team_members."""
         client, mock_session = mock_client
         
-        # Test missing org
-        with pytest.raises(GitHubAPIError, match="Organization name and team slug are required"):
-            client.get_team_members('', 'team-slug')
-        
-        # Test missing team_slug
-        with pytest.raises(GitHubAPIError, match="Organization name and team slug are required"):
-            client.get_team_members('myorg', '')
+        with pytest.raises(GitHubAPIError) as exc_info:
+            client.get_team_members(org, team_slug)
+        assert "Organization name and team slug are required" in str(exc_info.value)
     
     def test_expand_team_reviewers_success(self, mock_client):
         """Test successful expansion of team reviewers to individual members."""
@@ -945,7 +922,7 @@ class TestReviewerDataFetching:
                 return [{'id': 3, 'login': 'backend1'}, {'id': 1, 'login': 'frontend1'}]  # Duplicate ID 1
             return []
         
-        with patch.object(client, 'get_team_members', side_effect=mock_get_team_members):
+        with patch.object(client, 'get_team_members', autospec=True, side_effect=mock_get_team_members):
             result = client.expand_team_reviewers(teams, 'myorg')
         
         # Should have 3 unique members (duplicate removed)
@@ -982,7 +959,7 @@ class TestReviewerDataFetching:
             {'id': 11, 'slug': 'team-backend', 'name': 'Backend Team'}
         ]
         
-        with patch.object(client, 'get_team_members') as mock_get_members:
+        with patch.object(client, 'get_team_members', autospec=True) as mock_get_members:
             mock_get_members.return_value = [{'id': 3, 'login': 'backend1'}]
             
             result = client.expand_team_reviewers(teams, 'myorg')
@@ -1008,7 +985,7 @@ class TestReviewerDataFetching:
                 return [{'id': 3, 'login': 'backend1'}]
             return []
         
-        with patch.object(client, 'get_team_members', side_effect=mock_get_team_members):
+        with patch.object(client, 'get_team_members', autospec=True, side_effect=mock_get_team_members):
             result = client.expand_team_reviewers(teams, 'myorg')
         
         # Should return only successful team expansion
@@ -1077,6 +1054,24 @@ class TestReviewerDataFetching:
         # Should gracefully handle invalid data
         assert result['users'] == []
         assert result['teams'] == []
+    
+    def test_extract_reviewer_requests_from_pr_accepts_subclasses(self, mock_client):
+        """Test dict and list subclasses are accepted like plain dicts and lists."""
+        client, mock_session = mock_client
+        
+        class ReviewerList(list):
+            pass
+        
+        pr_data = OrderedDict([
+            ('number', 123),
+            ('requested_reviewers', ReviewerList([{'id': 1, 'login': 'reviewer1'}])),
+            ('requested_teams', ReviewerList([{'id': 10, 'slug': 'team-frontend'}]))
+        ])
+        
+        result = client.extract_reviewer_requests_from_pr(pr_data)
+        
+        assert result['users'] == [{'id': 1, 'login': 'reviewer1'}]
+        assert result['teams'] == [{'id': 10, 'slug': 'team-frontend'}]
 
 
 if __name__ == "__main__":
@@ -96,12 +96,12 @@ class TestEndToEndAnalysis:
         import shutil
         shutil.rmtree(self.tmpdir, ignore_errors=True)
     
-    @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'})
     @patch('github_pr_analyzer.GitHubClient')
     @patch('github_pr_analyzer.PRAnalyzer')
     @patch('github_pr_analyzer.CSVReporter')
-    def test_end_to_end_analysis_success(self, mock_csv_class, mock_analyzer_class, mock_client_class):
+    def test_end_to_end_analysis_success(self, mock_csv_class, mock_analyzer_class, mock_client_class, monkeypatch):
         """Test complete successful analysis workflow with all three metrics."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'test_token')
         # Configure mocks
         mock_client = Mock(spec=GitHubClient)
         mock_client.validate_token.return_value = True
@@ -135,10 +135,10 @@ class TestEndToEndAnalysis:
         mock_reporter.validate_analysis_results.assert_called_once_with(self.mock_analysis_results)
         mock_reporter.generate_report.assert_called_once_with(self.mock_analysis_results)
     
-    @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'})
     @patch('github_pr_analyzer.GitHubClient')
-    def test_end_to_end_authentication_failure(self, mock_client_class):
+    def test_end_to_end_authentication_failure(self, mock_client_class, monkeypatch):
         """Test handling of GitHub authentication failures."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'test_token')
         mock_client_class.get_token_from_env.side_effect = GitHubAuthenticationError("Invalid token")
         
         with patch('sys.argv', ['github_pr_analyzer.py', 'testowner/test-repo']):
@@ -146,10 +146,10 @@ class TestEndToEndAnalysis:
         
         assert result == 1
     
-    @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'})
     @patch('github_pr_analyzer.GitHubClient')
-    def test_end_to_end_repository_not_found(self, mock_client_class):
+    def test_end_to_end_repository_not_found(self, mock_client_class, monkeypatch):
         """Test handling of repository not found errors."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'test_token')
         mock_client = Mock(spec=GitHubClient)
         mock_client.validate_token.return_value = True
         mock_client.get_repository_info.side_effect = GitHubAPIError("Repository not found")
@@ -161,11 +161,11 @@ class TestEndToEndAnalysis:
         
         assert result == 1
     
-    @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'})
     @patch('github_pr_analyzer.GitHubClient')
     @patch('github_pr_analyzer.PRAnalyzer')
-    def test_end_to_end_no_prs_found(self, mock_analyzer_class, mock_client_class):
+    def test_end_to_end_no_prs_found(self, mock_analyzer_class, mock_client_class, monkeypatch):
         """Test handling when no PRs are found."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'test_token')
         # Configure mocks
         mock_client = Mock(spec=GitHubClient)
         mock_client.validate_token.return_value = True
@@ -327,19 +327,19 @@ class TestInputValidation:
 class TestErrorHandlingScenarios:
     """Test cases for various error conditions and edge cases."""
     
-    @patch.dict(os.environ, {}, clear=True)
-    def test_missing_github_token(self):
+    def test_missing_github_token(self, monkeypatch):
         """Test error handling when GITHUB_TOKEN is missing."""
+        monkeypatch.delenv('GITHUB_TOKEN', raising=False)
         with patch('sys.argv', ['github_pr_analyzer.py', 'owner/repo']):
             result = main()
         
         assert result == 1
     
-    @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'})
     @patch('github_pr_analyzer.GitHubClient')
     @patch('github_pr_analyzer.PRAnalyzer')
-    def test_pr_analysis_error(self, mock_analyzer_class, mock_client_class):
+    def test_pr_analysis_error(self, mock_analyzer_class, mock_client_class, monkeypatch):
         """Test handling of PR analysis errors."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'test_token')
         # Configure mocks
         mock_client = Mock(spec=GitHubClient)
         mock_client.validate_token.return_value = True
@@ -357,12 +357,12 @@ class TestErrorHandlingScenarios:
         
         assert result == 1
     
-    @patch.dict(os.environ, {'GITHUB_TOKEN': 'test_token'})
     @patch('github_pr_analyzer.GitHubClient')
     @patch('github_pr_analyzer.PRAnalyzer')
     @patch('github_pr_analyzer.CSVReporter')
-    def test_csv_generation_error(self, mock_csv_class, mock_analyzer_class, mock_client_class):
+    def test_csv_generation_error(self, mock_csv_class, mock_analyzer_class, mock_client_class, monkeypatch):
         """Test handling of CSV generation errors."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'test_token')
         # Configure mocks
         mock_client = Mock(spec=GitHubClient)
         mock_client.validate_token.return_value = True
@@ -892,21 +892,21 @@ class TestReviewerAnalysisCLIIntegration:
                     'name': 'Alice Johnson',
                     'total_requests': 3,
                     'pr_numbers': [100, 101, 102],
-                    'request_sources': ['individual', 'individual', 'individual']
+                    'request_sources': {'individual': 3}
                 },
                 'bob': {
                     'login': 'bob',
                     'name': 'Bob Smith',
                     'total_requests': 1,
                     'pr_numbers': [100],
-                    'request_sources': ['individual']
+                    'request_sources': {'individual': 1}
                 },
                 'charlie': {
                     'login': 'charlie',
                     'name': 'Charlie Brown',
                     'total_requests': 1,
                     'pr_numbers': [101],
-                    'request_sources': ['individual']
+                    'request_sources': {'individual': 1}
                 }
             },
             'statistics': {
@@ -10,7 +10,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 from datetime import datetime
 
-from reviewer_analyzer import ReviewerWorkloadAnalyzer
+from reviewer_analyzer import ReviewerWorkloadAnalyzer, _fast_iso_epoch
 
 
 class TestReviewerWorkloadAnalyzer(unittest.TestCase):
@@ -81,7 +81,7 @@ class TestReviewerWorkloadAnalyzer(unittest.TestCase):
         self.assertEqual(alice_data['name'], 'Alice Johnson')
         self.assertEqual(alice_data['total_requests'], 3)
         self.assertEqual(set(alice_data['pr_numbers']), {123, 124, 125})
-        self.assertEqual(alice_data['request_sources'], ['individual', 'individual', 'individual'])
+        self.assertEqual(alice_data['request_sources'], {'individual': 3})
         
         # Check Bob's data (should have 1 request)
         bob_data = result['bob']
@@ -163,6 +163,31 @@ class TestReviewerWorkloadAnalyzer(unittest.TestCase):
         self.assertEqual(result['good_user']['total_requests'], 1)
         self.assertEqual(result['team:valid-team']['total_requests'], 1)
     
+    def test_aggregate_reviewer_requests_skips_only_malformed_entries(self):
+        """Test a malformed entry mid-list doesn't drop the reviewers after it."""
+        prs = [
+            {
+                'number': 128,
+                'created_at': '2023-01-06T10:00:00Z',
+                'requested_reviewers': [
+                    {'login': 'before'},
+                    None,
+                    'not_a_dict',
+                    {'login': 'after'}
+                ],
+                'requested_teams': [
+                    {'name': 'team-a'},
+                    None,
+                    {'name': 'team-b'}
+                ]
+            }
+        ]
+        
+        result = self.analyzer.aggregate_reviewer_requests(prs, include_teams=True)
+        
+        self.assertEqual(set(result), {'before', 'after', 'team:team-a', 'team:team-b'})
+        self.assertEqual(result['after']['total_requests'], 1)
+    
     def test_detect_reviewer_overload_default_threshold(self):
         """Test overload detection with default threshold."""
         # Create reviewer data with various request counts
@@ -340,6 +365,12 @@ class TestReviewerWorkloadAnalyzer(unittest.TestCase):
         self.assertEqual(self.analyzer._calculate_gini_coefficient([]), 0.0)
         self.assertEqual(self.analyzer._calculate_gini_coefficient([10]), 0.0)
         self.assertEqual(self.analyzer._calculate_gini_coefficient([0, 0, 0]), 0.0)
+        
+        # Presorted (descending) input gives the same result without re-sorting
+        self.assertEqual(
+            self.analyzer._calculate_gini_coefficient([50, 40, 30, 20, 10], presorted_desc=True),
+            gini_moderate
+        )
     
     def test_get_reviewer_workload_summary(self):
         """Test comprehensive workload summary generation."""
@@ -411,6 +442,18 @@ class TestReviewerWorkloadAnalyzer(unittest.TestCase):
         self.assertEqual(user1_data['last_request_date'], '2023-02-01T10:00:00Z')
         self.assertEqual(user1_data['total_requests'], 3)
     
+    def test_fast_iso_epoch(self):
+        """Test that the fast timestamp parser agrees with datetime.fromisoformat."""
+        expected = datetime.fromisoformat('2023-01-15T10:30:45+00:00').timestamp()
+        
+        # GitHub 'Z' format (fast path) and explicit offsets (fallback path)
+        self.assertEqual(_fast_iso_epoch('2023-01-15T10:30:45Z'), expected)
+        self.assertEqual(_fast_iso_epoch('2023-01-15T10:30:45+00:00'), expected)
+        self.assertEqual(_fast_iso_epoch('2023-01-15T12:30:45+02:00'), expected)
+        
+        with self.assertRaises(ValueError):
+            _fast_iso_epoch('not-a-date')
+    
     def test_duplicate_pr_handling(self):
         """Test that duplicate PR numbers are handled correctly."""
         prs_with_duplicates = [